@@ -1,17 +1,37 @@
 #!/usr/bin/env python3
 import os
+import pickle
+import random
 import re
 import asyncio
 import argparse
 import logging
-from collections import deque
+from collections import OrderedDict, deque
+from functools import lru_cache
+from pathlib import Path
+import tempfile
 import time
-import httpx
-import json
+import aiofiles
+import orjson
+from aiolimiter import AsyncLimiter
 from environs import Env
 
-from bs4 import BeautifulSoup
-from aiohttp import ClientSession, ClientTimeout
+from selectolax.parser import HTMLParser
+from aiohttp import (
+    ClientError,
+    ClientSession,
+    ClientTimeout,
+    FormData,
+    TCPConnector,
+)
+
+# uvloop is POSIX-only; fall back to the stdlib event loop elsewhere
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
 
 logging.basicConfig(
     level=logging.INFO,
@@ -19,6 +39,66 @@ logging.basicConfig(
 )
 logger = logging.getLogger("nft-scanner")
 
+# Compiled once instead of per page/image
+_ID_RE = re.compile(r"#(\d+)")
+_B64_RE = re.compile(r"base64,(.+)", re.DOTALL)
+
+# Sentinel for cached negative check_nft lookups
+_NOT_FOUND = object()
+
+# Single-pass HTML escaping for notification text
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# Strip '%' and normalize the decimal comma in one C-level pass
+_RARITY_TRANS = str.maketrans({",": ".", "%": ""})
+
+# Transient statuses worth retrying with backoff
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Probed once at import; the mount can't appear or vanish mid-run
+IS_DOCKER = Path("/app/data").exists()
+
+
+def _backoff_delay(attempt, base=0.5, cap=8.0):
+    """Exponential backoff with full jitter for the given attempt number"""
+    return random.uniform(0, min(cap, base * (2**attempt)))
+
+
+@lru_cache(maxsize=4096)
+def _parse_rarity(s):
+    """Parse a rarity string like '2.1%' or '2,1%' into a float percentage.
+
+    Rarity strings repeat heavily across NFTs and polling cycles, so the
+    cache turns most calls into a dict hit.
+    """
+    return float(s.translate(_RARITY_TRANS).strip() or "100")
+
+
+def _atomic_write_json(path, obj):
+    """Write JSON to path atomically and durably (write-fsync-rename-fsync)"""
+    temp_file = f"{path}.tmp"
+    with open(temp_file, "wb") as f:
+        f.write(orjson.dumps(obj))
+        # Make sure the bytes hit the disk before the rename, otherwise a
+        # crash can leave a zero-length file behind the new name
+        f.flush()
+        os.fsync(f.fileno())
+
+    # Rename the temp file to the actual file (atomic operation on most filesystems)
+    os.replace(temp_file, path)
+
+    # Also fsync the directory so the rename itself is durable
+    try:
+        dir_fd = os.open(os.path.dirname(path) or ".", os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    except OSError:
+        # Not supported on this platform/filesystem; the data fsync above
+        # still protects the file contents
+        pass
+
 # Load environment variables from .env file
 env = Env()
 env.read_env()
@@ -34,47 +114,116 @@ if not BOT_TOKEN or not CHANNEL_ID:
 
 
 class TelegramNotifier:
-    def __init__(self, bot_token: str, channel_id: str):
+    def __init__(self, bot_token: str, channel_id: str, session: ClientSession):
         self.bot_token = bot_token
         self.channel_id = channel_id
         self.api_url = f"https://api.telegram.org/bot{bot_token}"
+        # Endpoint URLs never change at runtime; build them once
+        self._send_message_url = f"{self.api_url}/sendMessage"
+        self._send_document_url = f"{self.api_url}/sendDocument"
+        self._send_media_group_url = f"{self.api_url}/sendMediaGroup"
+        # Shared session so all sends reuse the same connection pool
+        self.session = session
+        # Stay within Telegram's ~30 messages/second global bot limit
+        self._send_sem = asyncio.Semaphore(30)
+
+    async def _post(self, url, label, json_payload=None, data_factory=None):
+        """POST to the Bot API, retrying 429/5xx with backoff and jitter.
+
+        data_factory rebuilds multipart bodies, which can't be replayed
+        after a failed attempt. A 429's retry_after hint is honored when
+        the Bot API provides one; otherwise the delay is exponential.
+        """
+        # Pre-serialize JSON bodies with orjson instead of aiohttp's
+        # stdlib-json dump
+        headers = None
+        if json_payload is not None:
+            json_body = orjson.dumps(json_payload)
+            headers = {"Content-Type": "application/json"}
+        else:
+            json_body = None
+
+        async with self._send_sem:
+            for attempt in range(5):
+                try:
+                    data = (
+                        data_factory() if data_factory is not None else json_body
+                    )
+                    async with self.session.post(
+                        url, data=data, headers=headers
+                    ) as resp:
+                        if resp.status in _RETRY_STATUSES and attempt < 4:
+                            retry_after = None
+                            if resp.status == 429:
+                                try:
+                                    body = await resp.json()
+                                    retry_after = body.get("parameters", {}).get(
+                                        "retry_after"
+                                    )
+                                except Exception:
+                                    pass
+                            delay = (
+                                retry_after
+                                if retry_after is not None
+                                else _backoff_delay(attempt)
+                            )
+                            logger.warning(
+                                "Telegram %s got %s, retrying in %.1fs",
+                                label,
+                                resp.status,
+                                delay,
+                            )
+                            await asyncio.sleep(delay)
+                            continue
+
+                        body = await resp.text()
+                        logger.info(
+                            "Telegram %s status: %s, response: %s",
+                            label,
+                            resp.status,
+                            body,
+                        )
+                        if resp.status != 200:
+                            logger.error("Failed to %s: %s", label, body)
+                        return resp.status
+                except ClientError as e:
+                    if attempt == 4:
+                        raise
+                    delay = _backoff_delay(attempt)
+                    logger.warning(
+                        "Telegram %s transport error (%s), retrying in %.1fs",
+                        label,
+                        e,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
 
     async def send_message(self, text: str):
-        url = f"{self.api_url}/sendMessage"
+        url = self._send_message_url
         payload = {"chat_id": self.channel_id, "text": text, "parse_mode": "HTML"}
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url, json=payload)
-            logger.info(
-                f"Telegram send_message status: {resp.status_code}, response: {resp.text}"
-            )
-            if resp.status_code != 200:
-                logger.error(f"Failed to send message: {resp.text}")
-            return resp
+        return await self._post(url, "send_message", json_payload=payload)
 
     async def send_document(self, file_bytes: bytes, filename: str, caption: str):
-        url = f"{self.api_url}/sendDocument"
-        files = {"document": (filename, file_bytes, "application/x-tgsticker")}
-        data = {"chat_id": self.channel_id, "caption": caption}
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url, data=data, files=files)
-            logger.info(
-                f"Telegram send_document status: {resp.status_code}, response: {resp.text}"
+        url = self._send_document_url
+
+        def build_form():
+            form = FormData()
+            form.add_field("chat_id", self.channel_id)
+            form.add_field("caption", caption)
+            form.add_field(
+                "document",
+                file_bytes,
+                filename=filename,
+                content_type="application/x-tgsticker",
             )
-            if resp.status_code != 200:
-                logger.error(f"Failed to send document: {resp.text}")
-            return resp
+            return form
+
+        return await self._post(url, "send_document", data_factory=build_form)
 
     async def send_media_group(self, media: list):
-        url = f"{self.api_url}/sendMediaGroup"
+        url = self._send_media_group_url
         data = {"chat_id": self.channel_id, "media": media}
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url, json=data)
-            logger.info(
-                f"Telegram sendMediaGroup status: {resp.status_code}, response: {resp.text}"
-            )
-            if resp.status_code != 200:
-                logger.error(f"Failed to send media group: {resp.text}")
-            return resp
+        return await self._post(url, "send_media_group", json_payload=data)
 
 
 class NFTScanner:
@@ -88,6 +237,8 @@ class NFTScanner:
         check_interval=5,
         gift_name="SnakeBox",
         respect_saved=False,
+        concurrency=20,
+        max_rate=10,
     ):
         self.start_id = start_id
         self.current_id = start_id  # Will be updated by _load_last_id if available
@@ -95,14 +246,53 @@ class NFTScanner:
         self.output_dir = output_dir
         self.gift_name = gift_name
         self.base_url = "https://t.me/nft/"
+        # gift_name is fixed per scanner; pre-bind the page URL prefix
+        self._url_prefix = f"{self.base_url}{gift_name}-"
         self.found_nfts = deque(maxlen=max_nfts)
+        # Running maximum of found IDs; avoids O(N) max() scans per cycle
+        self._highest_id = start_id - 1
         self.find_latest = find_latest
         self.monitor = monitor
         self.check_interval = check_interval
+        # Idle polling delay; grows while nothing is found and snaps back
+        # to check_interval on any hit
+        self._idle_backoff = float(check_interval)
+        # BOT_TOKEN never changes at runtime; build the send URLs used by
+        # the monitor loop once
+        self._tg_send_doc_url = (
+            f"https://api.telegram.org/bot{BOT_TOKEN}/sendDocument"
+        )
+        self._tg_send_group_url = (
+            f"https://api.telegram.org/bot{BOT_TOKEN}/sendMediaGroup"
+        )
         self.timeout = ClientTimeout(total=5)  # 5 second timeout for requests
-        self.notifier = TelegramNotifier(BOT_TOKEN, CHANNEL_ID)
+        self.concurrency = concurrency
+        self.sem = asyncio.Semaphore(concurrency)
+        # Token bucket: caps sustained request rate without serializing I/O
+        self.limiter = AsyncLimiter(max_rate, 1)
+        # Session and notifier are created in __aenter__ once the event loop runs
+        self.session = None
+        self.notifier = None
         self.respect_saved = respect_saved
 
+        # Short-lived result cache so the probe -> verify -> scan pipeline
+        # doesn't refetch the same page. Misses get a shorter TTL because new
+        # NFTs keep appearing at the tail of the range.
+        self._cache = OrderedDict()
+        self._cache_lock = asyncio.Lock()
+        self._cache_maxsize = 1024
+        self._cache_ttl = 300.0
+        self._miss_ttl = 30.0
+        # Conditional-GET validators per ID: (etag, last_modified, result)
+        self._etags = {}
+
+        # Pending state writes are coalesced by a background flusher so the
+        # monitor loop doesn't rewrite (and fsync) the state file every cycle
+        self._pending_last_id = None
+        self._dirty = None  # asyncio.Event, created in __aenter__
+        self._flusher_task = None
+        self._flush_interval = 10.0
+
         # Flag to track if we loaded data from file
         self._loaded_from_file = False
 
@@ -116,8 +306,24 @@ class NFTScanner:
             self.data_dir, f"last_id_{self.gift_name.lower()}.json"
         )
 
+        # Warm the rarity-parse cache from disk; the string -> float mapping
+        # is stable across restarts, so a restarted container skips the
+        # parsing work for every string it has already seen
+        self._rarity_cache_file = os.path.join(self.data_dir, "rarity_cache.pkl")
+        self._rarity_cache = {}
+        self._rarity_cache_dirty = False
+        try:
+            with open(self._rarity_cache_file, "rb") as f:
+                self._rarity_cache = pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, pickle.PickleError, EOFError) as e:
+            logger.warning("Failed to load rarity cache: %s", e)
+
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
+        # Resolved once; print_summary reuses it without a syscall per print
+        self._output_abs = str(Path(output_dir).resolve())
 
         # First load last checked ID from file if it exists
         self._load_last_id()
@@ -137,12 +343,95 @@ class NFTScanner:
             f"Initialized scanner for {self.gift_name} with ID: {self.current_id}"
         )
 
+    async def __aenter__(self):
+        # One shared session for scanner probes and Telegram sends: reusing the
+        # pool avoids a DNS lookup + TCP/TLS handshake per request
+        # aiohttp speaks HTTP/1.1 only, so bursts to api.telegram.org and
+        # the sticker CDN can't be multiplexed on one stream; the next best
+        # thing is keeping per-host connections warm across polling cycles
+        # so bursts reuse already-open sockets instead of re-handshaking
+        connector = TCPConnector(
+            limit=100, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=75
+        )
+        self.session = ClientSession(
+            timeout=self.timeout,
+            connector=connector,
+            # NFT pages are highly compressible HTML; negotiate gzip/brotli
+            # and let aiohttp auto-decompress
+            headers={
+                "Accept-Encoding": "gzip, br",
+                "User-Agent": "nft-scanner/1.0",
+            },
+        )
+        self.notifier = TelegramNotifier(BOT_TOKEN, CHANNEL_ID, self.session)
+        self._dirty = asyncio.Event()
+        self._flusher_task = asyncio.create_task(self._flush_state_loop())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._flusher_task.cancel()
+        try:
+            await self._flusher_task
+        except asyncio.CancelledError:
+            pass
+        self._flusher_task = None
+        # Don't lose the last coalesced update on shutdown
+        await self._flush_state_now()
+        await asyncio.to_thread(self._save_rarity_cache)
+        await self.session.close()
+        self.session = None
+        self.notifier = None
+
+    def _rarity_value(self, s):
+        """Parse a rarity string, consulting the persistent cache first"""
+        value = self._rarity_cache.get(s)
+        if value is None:
+            value = _parse_rarity(s)
+            self._rarity_cache[s] = value
+            self._rarity_cache_dirty = True
+        return value
+
+    def _save_rarity_cache(self):
+        """Flush newly seen rarity strings to disk (once, at shutdown)"""
+        if not self._rarity_cache_dirty:
+            return
+        try:
+            with open(self._rarity_cache_file, "wb") as f:
+                pickle.dump(
+                    self._rarity_cache, f, protocol=pickle.HIGHEST_PROTOCOL
+                )
+            self._rarity_cache_dirty = False
+        except OSError as e:
+            logger.error("Failed to save rarity cache: %s", e)
+
+    def _schedule_save_last_id(self, last_id):
+        """Record the latest ID to persist; the background flusher writes it"""
+        if self._pending_last_id is None or last_id > self._pending_last_id:
+            self._pending_last_id = last_id
+            self._dirty.set()
+
+    async def _flush_state_loop(self):
+        """Coalesce rapid last-id updates into one disk write per interval"""
+        while True:
+            await self._dirty.wait()
+            # Debounce: let further updates accumulate before touching disk
+            await asyncio.sleep(self._flush_interval)
+            self._dirty.clear()
+            # The write fsyncs, so keep it off the event loop
+            await asyncio.to_thread(self._save_last_id, self._pending_last_id)
+
+    async def _flush_state_now(self):
+        """Write any pending last-id update immediately"""
+        if self._dirty is not None and self._dirty.is_set():
+            self._dirty.clear()
+            await asyncio.to_thread(self._save_last_id, self._pending_last_id)
+
     def _load_last_id(self):
         """Load the last processed NFT ID from file"""
         if os.path.exists(self.last_id_file):
             try:
-                with open(self.last_id_file, "r") as f:
-                    data = json.load(f)
+                with open(self.last_id_file, "rb") as f:
+                    data = orjson.loads(f.read())
                     last_id = data.get("last_id")
                     if last_id is not None:
                         next_id = int(last_id) + 1  # Start from the next ID
@@ -173,16 +462,9 @@ class NFTScanner:
 
     def _save_last_id(self, last_id):
         try:
-            # First write to a temporary file, then rename to avoid corruption
-            temp_file = f"{self.last_id_file}.tmp"
-            with open(temp_file, "w") as f:
-                json.dump({"last_id": last_id, "timestamp": time.time()}, f)
-
-            # Rename the temp file to the actual file (atomic operation on most filesystems)
-            import os
-
-            os.replace(temp_file, self.last_id_file)
-
+            _atomic_write_json(
+                self.last_id_file, {"last_id": last_id, "timestamp": time.time()}
+            )
             logger.info(f"Saved last checked NFT ID for {self.gift_name}: {last_id}")
         except Exception as e:
             logger.error(f"Failed to save last ID to {self.last_id_file}: {e}")
@@ -191,59 +473,60 @@ class NFTScanner:
         """Use a binary search-like approach to quickly find the latest NFT ID"""
         logger.info("Finding the latest NFT ID using accelerated search...")
 
-        # Start with small steps first since NFT IDs might not be very high
-        initial_steps = [100, 500, 1000]
-        current_id = self.start_id
-        last_valid_id = None  # Initialize with None
-
-        # First phase: gradually increase ID with conservative step sizes
-        for step in initial_steps:
-            found_upper_bound = False
-            for _ in range(5):  # Try at most 5 jumps per step size
-                test_id = current_id + step
-                exists = await self.nft_exists_with_content_check(test_id, session)
-
-                if exists:
-                    logger.info(f"ID {test_id} exists, jumping by {step}")
-                    current_id = test_id
-                    last_valid_id = test_id
-                else:
-                    logger.info(
-                        f"ID {test_id} doesn't exist, found upper bound with step {step}"
-                    )
-                    found_upper_bound = True
-                    break
-
-            if found_upper_bound:
-                break
+        # First phase: probe a geometric sequence of offsets concurrently; the
+        # first miss gives the upper bound in roughly one round-trip
+        offsets = (100, 500, 1000, 2500, 5000, 10000)
+        probes = [self.start_id + offset for offset in offsets]
+        results = await asyncio.gather(
+            *(self.nft_exists_with_content_check(i, session) for i in probes)
+        )
+        first_miss = next(
+            (idx for idx, exists in enumerate(results) if not exists), None
+        )
 
-        # If we didn't find any valid ID in the first phase, check if the start_id is valid
-        if last_valid_id is None:
-            exists = await self.nft_exists_with_content_check(current_id, session)
-            if exists:
-                last_valid_id = current_id
-            else:
-                # No valid IDs found
+        if first_miss == 0:
+            # Even the smallest jump missed; check whether start_id itself is valid
+            exists = await self.nft_exists_with_content_check(self.start_id, session)
+            if not exists:
                 logger.warning(f"No valid NFTs found starting from ID {self.start_id}")
                 return self.start_id
+            lower_bound = self.start_id
+            upper_bound = probes[0]
+        elif first_miss is None:
+            # Every probe hit; keep doubling until we find a missing ID
+            lower_bound = probes[-1]
+            upper_bound = probes[-1] * 2
+            while await self.nft_exists_with_content_check(upper_bound, session):
+                lower_bound = upper_bound
+                upper_bound *= 2
+        else:
+            lower_bound = probes[first_miss - 1]
+            upper_bound = probes[first_miss]
 
-        # Second phase: binary search between last valid and first invalid
-        upper_bound = current_id + step  # The first ID we know doesn't exist
-        lower_bound = last_valid_id  # The last ID we know exists
-
+        # Second phase: narrow the range by probing three interior points per
+        # round concurrently (existence is monotone in the ID)
         logger.info(f"Starting binary search between {lower_bound} and {upper_bound}")
 
         while upper_bound - lower_bound > 1:
-            mid = lower_bound + (upper_bound - lower_bound) // 2
-            logger.info(f"Testing ID {mid} (range {lower_bound}-{upper_bound})")
+            span = upper_bound - lower_bound
+            mids = sorted(
+                {
+                    lower_bound + span // 4,
+                    lower_bound + span // 2,
+                    lower_bound + 3 * span // 4,
+                }
+            )
+            mids = [mid for mid in mids if lower_bound < mid < upper_bound]
+            logger.info(f"Testing IDs {mids} (range {lower_bound}-{upper_bound})")
 
-            exists = await self.nft_exists_with_content_check(mid, session)
-            if exists:
-                logger.info(f"ID {mid} exists, adjusting lower bound")
-                lower_bound = mid
-            else:
-                logger.info(f"ID {mid} doesn't exist, adjusting upper bound")
-                upper_bound = mid
+            mid_results = await asyncio.gather(
+                *(self.nft_exists_with_content_check(mid, session) for mid in mids)
+            )
+            for mid, exists in zip(mids, mid_results):
+                if exists:
+                    lower_bound = max(lower_bound, mid)
+                else:
+                    upper_bound = min(upper_bound, mid)
 
         latest_id = lower_bound
         logger.info(f"Found latest NFT ID: {latest_id}")
@@ -270,7 +553,7 @@ class NFTScanner:
 
     async def nft_exists(self, nft_id, session):
         """Check if an NFT with the given ID exists based on HTTP status"""
-        url = f"{self.base_url}SnakeBox-{nft_id}"
+        url = self._url_prefix + str(nft_id)
         try:
             async with session.get(url, timeout=self.timeout) as response:
                 return response.status == 200
@@ -283,27 +566,23 @@ class NFTScanner:
 
     async def nft_exists_with_content_check(self, nft_id, session):
         """Check if an NFT with the given ID exists by examining page content"""
-        url = f"{self.base_url}{self.gift_name}-{nft_id}"
+        url = self._url_prefix + str(nft_id)
         try:
-            async with session.get(url, timeout=self.timeout) as response:
+            # Cheap probe first: a HEAD transfers no body at all for missing IDs
+            async with session.head(
+                url, timeout=self.timeout, allow_redirects=False
+            ) as response:
                 if response.status != 200:
                     return False
 
-                # Check content to verify it's a valid NFT page
-                html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
-
-                # Look for NFT-specific elements
-                nft_name_element = soup.select_one("text[font-size='23']")
-                nft_id_element = soup.select_one("text[font-size='15']")
-
-                # Check for characteristic elements of a valid NFT page
-                if nft_name_element and nft_id_element:
-                    # Verify it's a valid collectible ID by checking the text
-                    if "Collectible #" in nft_id_element.text:
-                        return True
+            # The page exists; scan the first chunk of raw bytes for the
+            # collectible marker instead of parsing the whole document
+            async with session.get(url, timeout=self.timeout) as response:
+                if response.status != 200:
+                    return False
 
-                return False
+                chunk = await response.content.read(32_768)
+                return b"Collectible #" in chunk
 
         except asyncio.TimeoutError:
             logger.warning(f"Request for ID {nft_id} timed out")
@@ -312,106 +591,166 @@ class NFTScanner:
             logger.warning(f"Error checking NFT {nft_id}: {e}")
             return False
 
+    def _cache_get(self, key):
+        """Return (hit, value) for a cache key, evicting expired entries"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return False, None
+        value, expires = entry
+        if time.monotonic() >= expires:
+            del self._cache[key]
+            return False, None
+        self._cache.move_to_end(key)
+        return True, value
+
+    def _cache_put(self, key, value):
+        """Store a check_nft result with LRU eviction"""
+        ttl = self._miss_ttl if value is _NOT_FOUND else self._cache_ttl
+        self._cache[key] = (value, time.monotonic() + ttl)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_maxsize:
+            self._cache.popitem(last=False)
+
     async def check_nft(self, nft_id, session):
         """Check if NFT with given ID exists and extract its data"""
-        url = f"{self.base_url}{self.gift_name}-{nft_id}"
+        key = (self.gift_name, nft_id)
+        async with self._cache_lock:
+            hit, value = self._cache_get(key)
+        if hit:
+            return None if value is _NOT_FOUND else value
+
+        nft_data = await self._fetch_nft(nft_id, session)
+
+        async with self._cache_lock:
+            self._cache_put(key, _NOT_FOUND if nft_data is None else nft_data)
+        return nft_data
+
+    async def _fetch_nft(self, nft_id, session):
+        """Fetch an NFT page and extract its data"""
+        url = self._url_prefix + str(nft_id)
+
+        # Revalidate known pages instead of re-downloading them: a 304
+        # response carries no body and skips the parse entirely
+        cached = self._etags.get(nft_id)
+        headers = None
+        if cached is not None:
+            etag, last_modified, _ = cached
+            headers = {}
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
         try:
-            async with session.get(url, timeout=self.timeout) as response:
-                if response.status != 200:
-                    return None
-
-                html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
-
-                # Extract NFT name
-                name_element = soup.select_one("text[font-size='23']")
-                if not name_element:
-                    return None
-                nft_name = name_element.text.strip()
-
-                # Extract NFT full ID (including collection number)
-                id_element = soup.select_one("text[font-size='15']")
-                if not id_element:
-                    return None
-                full_id = id_element.text.strip()
-                # Extract just the numeric part
-                id_match = re.search(r"#(\d+)", full_id)
-                if not id_match:
-                    nft_number = nft_id
-                else:
-                    nft_number = id_match.group(1)
+            async with self.sem, self.limiter:
+                async with session.get(
+                    url, timeout=self.timeout, headers=headers
+                ) as response:
+                    if response.status == 304 and cached is not None:
+                        return cached[2]
+                    if response.status != 200:
+                        return None
 
-                # Extract image URL
-                image_element = soup.select_one(
-                    "picture.tgme_gift_model source[type='application/x-tgsticker']"
-                )
-                if not image_element:
-                    # Try the SVG version if TGS sticker not found
-                    image_element = soup.select_one(
-                        "picture.tgme_gift_model source[type='image/svg+xml']"
-                    )
-                    if not image_element:
+                    html = await response.text()
+                    tree = HTMLParser(html)
+
+                    # Extract NFT name
+                    name_element = tree.css_first("text[font-size='23']")
+                    if not name_element:
                         return None
+                    nft_name = name_element.text().strip()
 
-                image_url = image_element.get("srcset", "")
+                    # Extract NFT full ID (including collection number)
+                    id_element = tree.css_first("text[font-size='15']")
+                    if not id_element:
+                        return None
+                    full_id = id_element.text().strip()
+                    # Extract just the numeric part
+                    id_match = _ID_RE.search(full_id)
+                    if not id_match:
+                        nft_number = nft_id
+                    else:
+                        nft_number = id_match.group(1)
 
-                # If it's a data URI, we'll need to handle it differently
-                if isinstance(image_url, str) and image_url.startswith("data:"):
-                    image_type = "svg"
-                    image_data = image_url
-                else:
-                    image_type = (
-                        "tgs"
-                        if isinstance(image_url, str) and "sticker.tgs" in image_url
-                        else "unknown"
+                    # Extract image URL
+                    image_element = tree.css_first(
+                        "picture.tgme_gift_model source[type='application/x-tgsticker']"
                     )
+                    if not image_element:
+                        # Try the SVG version if TGS sticker not found
+                        image_element = tree.css_first(
+                            "picture.tgme_gift_model source[type='image/svg+xml']"
+                        )
+                        if not image_element:
+                            return None
 
-                # Extract rarity information
-                rarity_info = self.extract_rarity_info(soup)
-
-                return {
-                    "id": nft_id,
-                    "name": nft_name,
-                    "full_id": full_id,
-                    "image_url": image_url,
-                    "image_type": image_type,
-                    "rarity": rarity_info,
-                    "gift_name": self.gift_name,
-                }
+                    image_url = image_element.attributes.get("srcset", "")
+
+                    # If it's a data URI, we'll need to handle it differently
+                    if isinstance(image_url, str) and image_url.startswith("data:"):
+                        image_type = "svg"
+                        image_data = image_url
+                    else:
+                        image_type = (
+                            "tgs"
+                            if isinstance(image_url, str) and "sticker.tgs" in image_url
+                            else "unknown"
+                        )
+
+                    # Extract rarity information
+                    rarity_info = self.extract_rarity_info(tree)
+
+                    nft_data = {
+                        "id": nft_id,
+                        "name": nft_name,
+                        "full_id": full_id,
+                        "image_url": image_url,
+                        "image_type": image_type,
+                        "rarity": rarity_info,
+                        "gift_name": self.gift_name,
+                    }
+
+                    # Remember the validators so the next probe of this ID
+                    # can be answered with a bodyless 304
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    if etag or last_modified:
+                        self._etags[nft_id] = (etag, last_modified, nft_data)
+
+                    return nft_data
 
         except Exception as e:
             logger.error(f"Error checking NFT {nft_id}: {e}")
             return None
 
-    def extract_rarity_info(self, soup):
+    def extract_rarity_info(self, tree):
         """Extract rarity information from the NFT page"""
         rarity_info = {}
 
-        # Find the rarity table
-        rarity_table = soup.select_one(".tgme_gift_table")
-        if not rarity_table:
-            return rarity_info
-
-        # Extract rows from the table
-        rows = rarity_table.select("tr")
-        for row in rows:
-            # Each row has a header (property name) and value with possible rarity percentage
-            header = row.select_one("th")
-            value_cell = row.select_one("td")
+        # Extract rows from the rarity table; one walk over each row's
+        # direct children instead of a subtree search per cell
+        for row in tree.css(".tgme_gift_table tr"):
+            header = None
+            value_cell = None
+            for cell in row.iter():
+                if cell.tag == "th":
+                    header = cell
+                elif cell.tag == "td":
+                    value_cell = cell
 
             if header and value_cell:
-                property_name = header.text.strip()
+                property_name = header.text().strip()
 
-                # Check if there's a rarity mark
-                rarity_mark = value_cell.select_one("mark")
+                # Check if there's a rarity mark; its text is sliced out of
+                # the already-extracted cell text rather than re-walked
+                cell_text = value_cell.text()
+                rarity_mark = value_cell.css_first("mark")
                 if rarity_mark:
-                    # Extract the property value without the rarity percentage
-                    property_value = (
-                        value_cell.get_text().replace(rarity_mark.text, "").strip()
-                    )
-                    rarity_percentage = rarity_mark.text.strip()
+                    mark_text = rarity_mark.text()
+                    property_value = cell_text.replace(mark_text, "").strip()
+                    rarity_percentage = mark_text.strip()
                 else:
-                    property_value = value_cell.text.strip()
+                    property_value = cell_text.strip()
                     rarity_percentage = None
 
                 rarity_info[property_name] = {
@@ -430,15 +769,15 @@ class NFTScanner:
             image_url = nft_data["image_url"]
             if isinstance(image_url, str) and image_url.startswith("data:"):
                 # Extract the base64 data
-                match = re.search(r"base64,(.+)", image_url)
+                match = _B64_RE.search(image_url)
                 if match:
                     import base64
 
                     svg_data = base64.b64decode(match.group(1))
-                    with open(
+                    async with aiofiles.open(
                         os.path.join(self.output_dir, f"{filename}.svg"), "wb"
                     ) as f:
-                        f.write(svg_data)
+                        await f.write(svg_data)
                     logger.info(
                         f"Saved SVG image for {nft_data['name']} #{nft_data['id']}"
                     )
@@ -456,9 +795,11 @@ class NFTScanner:
                     )
                     return False
 
-                image_data = await response.read()
-                with open(filepath, "wb") as f:
-                    f.write(image_data)
+                # Stream to disk so memory stays bounded and the write
+                # overlaps with the network receive
+                async with aiofiles.open(filepath, "wb") as f:
+                    async for chunk in response.content.iter_chunked(65536):
+                        await f.write(chunk)
 
                 logger.info(
                     f"Downloaded image for {nft_data['name']} #{nft_data['id']}"
@@ -472,88 +813,177 @@ class NFTScanner:
 
     async def scan(self):
         """Main scanning function to find and download the latest NFTs"""
-        async with ClientSession(timeout=self.timeout) as session:
-            # If enabled, find the latest NFT ID, but only if we don't have a recent saved ID
-            should_skip_search = self._loaded_from_file and self.respect_saved
-
-            if self.find_latest and not should_skip_search:
-                # We'll only run the latest check if find_latest is enabled AND we either
-                # 1. Didn't load from file, or
-                # 2. Are explicitly ignoring saved files (respect_saved=False)
-                logger.info(
-                    f"Finding latest NFT ID starting from current ID: {self.current_id}"
-                )
-                latest_id = await self.find_latest_nft_id(session)
-
-                # Double-check that this ID is valid before proceeding
-                latest_nft = await self.check_nft(latest_id, session)
-                if not latest_nft:
-                    logger.warning(
-                        f"Found latest ID {latest_id} but verification failed, falling back to current ID {self.current_id}"
-                    )
-                    latest_id = self.current_id
+        session = self.session
+        # If enabled, find the latest NFT ID, but only if we don't have a recent saved ID
+        should_skip_search = self._loaded_from_file and self.respect_saved
+
+        if self.find_latest and not should_skip_search:
+            # We'll only run the latest check if find_latest is enabled AND we either
+            # 1. Didn't load from file, or
+            # 2. Are explicitly ignoring saved files (respect_saved=False)
+            logger.info(
+                f"Finding latest NFT ID starting from current ID: {self.current_id}"
+            )
+            latest_id = await self.find_latest_nft_id(session)
 
-                # Calculate how many NFTs back we need to go to get max_nfts
-                # but never go below our current ID
-                start_id = max(self.current_id, latest_id - self.max_nfts + 1)
-                self.current_id = start_id
-                logger.info(
-                    f"Latest NFT ID: {latest_id}. Starting scan from ID {start_id} to get up to {self.max_nfts} latest NFTs"
-                )
-            elif should_skip_search:
-                logger.info(
-                    f"Using saved ID from file: {self.current_id - 1}, skipping binary search and starting scan from {self.current_id}"
+            # Double-check that this ID is valid before proceeding
+            latest_nft = await self.check_nft(latest_id, session)
+            if not latest_nft:
+                logger.warning(
+                    f"Found latest ID {latest_id} but verification failed, falling back to current ID {self.current_id}"
                 )
+                latest_id = self.current_id
 
-            # Main scanning loop
-            valid_results = 0
-            consecutive_empty = 0
-            max_consecutive_empty = (
-                10  # Stop scanning after this many consecutive misses
+            # Calculate how many NFTs back we need to go to get max_nfts
+            # but never go below our current ID
+            start_id = max(self.current_id, latest_id - self.max_nfts + 1)
+            self.current_id = start_id
+            logger.info(
+                f"Latest NFT ID: {latest_id}. Starting scan from ID {start_id} to get up to {self.max_nfts} latest NFTs"
             )
+        elif should_skip_search:
+            logger.info(
+                f"Using saved ID from file: {self.current_id - 1}, skipping binary search and starting scan from {self.current_id}"
+            )
+
+        # Main scanning loop: check a window of IDs concurrently and stop
+        # once a contiguous run of misses appears at the tail
+        valid_results = 0
+        consecutive_empty = 0
+        max_consecutive_empty = (
+            10  # Stop scanning after this many consecutive misses
+        )
+        scanning = True
+
+        while scanning and valid_results < self.max_nfts:
+            ids = range(self.current_id, self.current_id + self.concurrency)
+            logger.info(f"Checking NFT IDs: {ids.start}-{ids.stop - 1}")
 
-            while (
-                valid_results < self.max_nfts
-                and consecutive_empty < max_consecutive_empty
-            ):
-                logger.info(f"Checking NFT ID: {self.current_id}")
+            results = await asyncio.gather(
+                *(self.check_nft(nft_id, session) for nft_id in ids)
+            )
 
-                nft_data = await self.check_nft(self.current_id, session)
+            for nft_id, nft_data in zip(ids, results):
+                self.current_id = nft_id + 1
 
                 if nft_data:
-                    logger.info(f"Found NFT: {nft_data['name']} {nft_data['full_id']}")
+                    logger.info(
+                        f"Found NFT: {nft_data['name']} {nft_data['full_id']}"
+                    )
                     self.found_nfts.append(nft_data)
+                    if nft_data["id"] > self._highest_id:
+                        self._highest_id = nft_data["id"]
                     await self.download_image(nft_data, session)
                     valid_results += 1
                     consecutive_empty = 0  # Reset counter on successful find
+                    if valid_results >= self.max_nfts:
+                        scanning = False
+                        break
                 else:
                     consecutive_empty += 1
                     if consecutive_empty >= max_consecutive_empty:
                         logger.info(
                             f"Reached {max_consecutive_empty} consecutive NFTs not found, stopping scan"
                         )
+                        scanning = False
                         break
 
-                self.current_id += 1
-                await asyncio.sleep(1)  # Wait 1 second between requests
-
-            # Save the last checked ID for continuity
-            if valid_results > 0:
-                # Find the highest ID we got
-                highest_id = max(nft["id"] for nft in self.found_nfts)
-                self._save_last_id(highest_id)
-
-            self.print_summary()
-
-            # If monitoring mode is enabled, start continuous monitoring
-            if self.monitor:
-                await self.monitor_new_nfts(session)
+        # Save the last checked ID for continuity
+        if valid_results > 0:
+            self._schedule_save_last_id(self._highest_id)
+
+        self.print_summary()
+
+        # If monitoring mode is enabled, start continuous monitoring
+        if self.monitor:
+            await self.monitor_new_nfts(session)
+
+    async def _fetch_sticker(self, idx, nft, session, sem):
+        """Download one sticker body for a media group, bounded by sem.
+
+        Returns (attach_name, file object) or None when the CDN says no.
+        Bodies are streamed into a spooled temp file, so small stickers
+        stay in memory while big ones spill to disk instead of the whole
+        batch being buffered as bytes.
+        """
+        async with sem:
+            for attempt in range(5):
+                try:
+                    async with session.get(
+                        nft["image_url"], timeout=self.timeout
+                    ) as resp:
+                        if resp.status in _RETRY_STATUSES and attempt < 4:
+                            retry_after = resp.headers.get("Retry-After")
+                            delay = (
+                                float(retry_after)
+                                if retry_after
+                                else _backoff_delay(attempt)
+                            )
+                            await asyncio.sleep(delay)
+                            continue
+                        if resp.status != 200:
+                            return None
+                        buf = tempfile.SpooledTemporaryFile(max_size=512_000)
+                        async for chunk in resp.content.iter_chunked(65536):
+                            buf.write(chunk)
+                        buf.seek(0)
+                        return f"file{idx}.tgs", buf
+                except ClientError:
+                    if attempt == 4:
+                        raise
+                    await asyncio.sleep(_backoff_delay(attempt))
+
+    async def _send_single_document(self, idx, nft, files, session, sem):
+        """Send one sticker via sendDocument, bounded by sem.
+
+        Used when a sendMediaGroup call fails and the batch is retried
+        document by document.
+        """
+        attach_name = f"file{idx}.tgs"
+        buf = files.get(attach_name)
+        if buf is None:
+            return
+
+        url = self._tg_send_doc_url
+        async with sem:
+            for attempt in range(5):
+                # Rebuild the form each attempt; multipart bodies can't be
+                # replayed, and the previous try may have consumed the stream
+                buf.seek(0)
+                form = FormData()
+                form.add_field("chat_id", CHANNEL_ID)
+                form.add_field("caption", f"{nft['name']} {nft['full_id']}")
+                form.add_field("parse_mode", "HTML")
+                form.add_field(
+                    "document",
+                    buf,
+                    filename=attach_name,
+                    content_type="application/x-tgsticker",
+                )
+                try:
+                    async with session.post(url, data=form) as resp:
+                        if resp.status in _RETRY_STATUSES and attempt < 4:
+                            retry_after = resp.headers.get("Retry-After")
+                            delay = (
+                                float(retry_after)
+                                if retry_after
+                                else _backoff_delay(attempt)
+                            )
+                            await asyncio.sleep(delay)
+                            continue
+                        logger.info(
+                            "Individual document send status: %s", resp.status
+                        )
+                        return
+                except ClientError:
+                    if attempt == 4:
+                        raise
+                    await asyncio.sleep(_backoff_delay(attempt))
 
     async def monitor_new_nfts(self, session):
         """Continuously monitor for new NFTs beyond the latest known ID, polling every 3 seconds and batching results."""
         if self.found_nfts:
-            highest_id = max(nft["id"] for nft in self.found_nfts)
-            next_id = highest_id + 1
+            next_id = self._highest_id + 1
         else:
             next_id = self.current_id
 
@@ -583,9 +1013,14 @@ class NFTScanner:
                     nft_data = await self.check_nft(poll_current, session)
                     if nft_data:
                         logger.info(
-                            f"New NFT found and added to batch: {nft_data['name']} {nft_data['full_id']} (ID: {nft_data['id']})"
+                            "New NFT found and added to batch: %s %s (ID: %s)",
+                            nft_data["name"],
+                            nft_data["full_id"],
+                            nft_data["id"],
                         )
                         self.found_nfts.append(nft_data)
+                        if nft_data["id"] > self._highest_id:
+                            self._highest_id = nft_data["id"]
                         batch_nfts.append(nft_data)
                         poll_current += 1
                         consecutive_not_found = 0  # Reset counter on successful find
@@ -598,24 +1033,26 @@ class NFTScanner:
                             found_gap = True
                             break
                         logger.info(
-                            f"NFT ID {poll_current} not found, checking next ID"
+                            "NFT ID %s not found, checking next ID", poll_current
                         )
                         poll_current += 1
                         await asyncio.sleep(0.5)
 
                 elapsed_time = time.time() - poll_start_time
                 logger.info(
-                    f"Polling completed in {elapsed_time:.2f} seconds, found {len(batch_nfts)} NFTs"
+                    "Polling completed in %.2f seconds, found %s NFTs",
+                    elapsed_time,
+                    len(batch_nfts),
                 )
 
                 # Only update next_id if we found at least one NFT
                 if batch_nfts:
                     # Update next_id to the ID after the last found NFT
-                    next_id = max(nft["id"] for nft in batch_nfts) + 1
+                    next_id = self._highest_id + 1
                     logger.info(f"Updated next ID to {next_id} for next polling cycle")
 
                     # Save the highest ID we've found
-                    self._save_last_id(next_id - 1)
+                    self._schedule_save_last_id(next_id - 1)
                 elif found_gap:
                     # If we hit a gap (consecutive not found), stay at the current position
                     logger.info(
@@ -630,299 +1067,305 @@ class NFTScanner:
 
                 # Send notifications for found NFTs
                 if batch_nfts:
-                    # Find any super rare NFTs first
+                    # A hit resets the idle backoff to the base interval
+                    self._idle_backoff = float(self.check_interval)
+
+                    # One pass over the batch: classify super-rare, build the
+                    # notification links, and collect Neo Matrix candidates
+                    # side by side so the shared dict lookups and parsed
+                    # rarity floats stay warm
                     any_super_rare = False
+                    links = []
+                    filtered_nfts = []
                     for nft in batch_nfts:
+                        # Bind the hot dict keys once; they're re-used by the
+                        # link line, the filter, and the log lines below
+                        gift_name = nft["gift_name"]
+                        nft_id = nft["id"]
+                        full_id = nft["full_id"]
+                        name = nft["name"]
+
                         is_super_rare = False
                         super_rare_properties = []
                         if nft.get("rarity"):
+                            # No early break here: the full property list
+                            # feeds the notification tag, so every entry is
+                            # classified (the cached parse makes that cheap)
                             for prop, info in nft["rarity"].items():
-                                if info.get("rarity"):
-                                    try:
-                                        rarity_text = (
-                                            info["rarity"]
-                                            .strip()
-                                            .replace("%", "")
-                                            .replace(",", ".")
-                                        )
-                                        rarity_value = float(rarity_text)
-                                        if rarity_value < 0.6:
-                                            is_super_rare = True
-                                            any_super_rare = True
-                                            super_rare_properties.append(
-                                                f"{prop}: {info['value']} ({info['rarity']})"
-                                            )
-                                    except (ValueError, TypeError):
-                                        pass
+                                rarity_str = info.get("rarity")
+                                if not rarity_str:
+                                    continue
+                                try:
+                                    rarity_value = self._rarity_value(rarity_str)
+                                except (ValueError, TypeError):
+                                    continue
+                                # The Neo Matrix check below needs the same
+                                # float; stash it so that check is a dict
+                                # lookup, not another parse
+                                if prop == "Model":
+                                    nft["_model_rarity_f"] = rarity_value
+                                if rarity_value < 0.6:
+                                    is_super_rare = True
+                                    any_super_rare = True
+                                    super_rare_properties.append(
+                                        f"{prop}: {info['value']} ({rarity_str})"
+                                    )
                         nft["is_super_rare"] = is_super_rare
                         nft["super_rare_properties"] = super_rare_properties
 
-                        # Add super_rare tag if applicable
-                        super_rare_tag = ""
-                        if nft["is_super_rare"]:
-                            super_rare_tag = " #super_rare"
-                            # Add which properties triggered super_rare
-                            if nft["super_rare_properties"]:
-                                super_rare_tag += f" (Ultra rare: {', '.join(nft['super_rare_properties'])})"
-
-                        # Only proceed with notification if at least one NFT is super rare
-                        if any_super_rare:
-                            # Compose message with all NFT links
-                            if len(batch_nfts) == 1:
-                                # For a single NFT, include detailed information
-                                nft = batch_nfts[0]
-                                # Escape HTML special characters in the name
-                                safe_name = (
-                                    nft["name"]
-                                    .replace("&", "&amp;")
-                                    .replace("<", "&lt;")
-                                    .replace(">", "&gt;")
-                                )
+                        if is_super_rare:
+                            safe_name = name.translate(_HTML_ESCAPE)
 
-                                # Add super_rare tag if applicable
-                                super_rare_tag = (
-                                    " #super_rare" if nft["is_super_rare"] else ""
-                                )
+                            # Add super_rare tag with specific properties
+                            super_rare_tag = " #super_rare"
+                            if super_rare_properties:
+                                super_rare_tag += f" (Ultra rare: {', '.join(super_rare_properties)})"
 
-                                message = (
-                                    f"<b>New NFT found:</b>\n"
-                                    f"<a href='https://t.me/nft/{nft['gift_name']}-{nft['id']}'>"
-                                    f"<code>{safe_name}</code> {nft['full_id']}</a>{super_rare_tag}"
-                                )
+                            links.append(
+                                f"<a href='https://t.me/nft/{gift_name}-{nft_id}'>"
+                                f"<code>{safe_name}</code> {full_id}</a>{super_rare_tag}"
+                            )
 
-                                # Add rarity information if available
-                                if nft.get("rarity"):
-                                    message += "\n\n<b>Rarity Information:</b>"
-                                    for prop, info in nft["rarity"].items():
-                                        # Escape property values as well
-                                        safe_value = (
-                                            info["value"]
-                                            .replace("&", "&amp;")
-                                            .replace("<", "&lt;")
-                                            .replace(">", "&gt;")
-                                        )
-                                        rarity_str = (
-                                            f" ({info['rarity']})"
-                                            if info["rarity"]
-                                            else ""
-                                        )
-                                        message += f"\n• {prop}: <code>{safe_value}</code>{rarity_str}"
-                            else:
-                                # For multiple NFTs, just use links with escaped names
-                                links = []
-                                for nft in batch_nfts:
-                                    if not nft["is_super_rare"]:
-                                        continue  # Skip non-super rare NFTs
-
-                                    safe_name = (
-                                        nft["name"]
-                                        .replace("&", "&amp;")
-                                        .replace("<", "&lt;")
-                                        .replace(">", "&gt;")
+                        # Filter for Model == 'Neo Matrix' and Model rarity <= 2.1%.
+                        # Sparse rarity data is the common sad path, so guard
+                        # with cheap lookups instead of a blanket try/except
+                        rarity_info = nft.get("rarity")
+                        model_info = (
+                            rarity_info.get("Model")
+                            if isinstance(rarity_info, dict)
+                            else None
+                        )
+                        # Almost no NFTs are Neo Matrix TGS stickers, so run
+                        # the cheap equality checks first and only parse the
+                        # rarity for actual candidates
+                        if (
+                            model_info
+                            and model_info.get("value", "") == "Neo Matrix"
+                            and nft["image_type"] == "tgs"
+                        ):
+                            rarity_value = nft.get("_model_rarity_f")
+                            if rarity_value is None:
+                                try:
+                                    rarity_value = self._rarity_value(
+                                        model_info.get("rarity", "100%")
                                     )
+                                except (ValueError, TypeError):
+                                    rarity_value = 100.0
 
-                                    # Add super_rare tag with specific properties
-                                    super_rare_tag = " #super_rare"
-                                    if nft["super_rare_properties"]:
-                                        super_rare_tag += f" (Ultra rare: {', '.join(nft['super_rare_properties'])})"
+                            if rarity_value <= 2.1:
+                                filtered_nfts.append(nft)
+                                logger.info(
+                                    "Found qualifying Neo Matrix NFT with rarity %s%%",
+                                    rarity_value,
+                                )
 
-                                    links.append(
-                                        f"<a href='https://t.me/nft/{nft['gift_name']}-{nft['id']}'>"
-                                        f"<code>{safe_name}</code> {nft['full_id']}</a>{super_rare_tag}"
-                                    )
+                    # Only proceed with notification if at least one NFT is super rare
+                    if any_super_rare:
+                        # Compose message with all NFT links
+                        if len(batch_nfts) == 1:
+                            # For a single NFT, include detailed information
+                            nft = batch_nfts[0]
+                            # Escape HTML special characters in the name
+                            safe_name = nft["name"].translate(_HTML_ESCAPE)
+
+                            # Add super_rare tag if applicable
+                            super_rare_tag = (
+                                " #super_rare" if nft["is_super_rare"] else ""
+                            )
 
-                                if links:  # Only create message if we have links after filtering
-                                    message = "<b>New NFTs found:</b>\n" + "\n".join(
-                                        links
+                            message = (
+                                f"<b>New NFT found:</b>\n"
+                                f"<a href='https://t.me/nft/{nft['gift_name']}-{nft['id']}'>"
+                                f"<code>{safe_name}</code> {nft['full_id']}</a>{super_rare_tag}"
+                            )
+
+                            # Add rarity information if available
+                            if nft.get("rarity"):
+                                message += "\n\n<b>Rarity Information:</b>"
+                                for prop, info in nft["rarity"].items():
+                                    # Escape property values as well
+                                    safe_value = info["value"].translate(_HTML_ESCAPE)
+                                    rarity_str = (
+                                        f" ({info['rarity']})" if info["rarity"] else ""
                                     )
-                                else:
-                                    message = None  # No super rare NFTs to report
+                                    message += f"\n• {prop}: <code>{safe_value}</code>{rarity_str}"
+                        elif links:
+                            # For multiple NFTs, just use the links collected above
+                            message = "<b>New NFTs found:</b>\n" + "\n".join(links)
+                        else:
+                            message = None  # No super rare NFTs to report
+
+                        if message:
+                            await self.notifier.send_message(message)
+
+                        # Prepare media group for Telegram (must be file_id or attach:// for new uploads)
+                        if filtered_nfts:
+                            logger.info(
+                                "Found %s NFTs that match Neo Matrix filtering criteria",
+                                len(filtered_nfts),
+                            )
+                            try:
+                                # Download all stickers concurrently; the
+                                # batch costs one round trip instead of N
+                                media = []
+                                files = {}
+
+                                sticker_sem = asyncio.Semaphore(10)
+                                results = await asyncio.gather(
+                                    *(
+                                        self._fetch_sticker(
+                                            idx, nft, session, sticker_sem
+                                        )
+                                        for idx, nft in enumerate(filtered_nfts)
+                                    ),
+                                    return_exceptions=True,
+                                )
 
-                            if message:
-                                await self.notifier.send_message(message)
+                                for nft, result in zip(filtered_nfts, results):
+                                    if isinstance(result, Exception):
+                                        logger.error(
+                                            "Error preparing media for NFT %s: %s",
+                                            nft["id"],
+                                            result,
+                                        )
+                                        continue
+                                    if result is None:
+                                        continue
 
-                            # Filter for Model == 'Neo Matrix' and Model rarity <= 2.1%
-                            filtered_nfts = []
-                            for nft in batch_nfts:
-                                try:
-                                    # Get rarity info in a more robust way
-                                    model_info = nft.get("rarity", {}).get("Model", {})
-                                    model_name = model_info.get("value", "")
-                                    model_rarity = model_info.get("rarity", "100%")
+                                    attach_name, buf = result
+                                    files[attach_name] = buf
 
-                                    # Clean and parse the rarity value
-                                    rarity_text = (
-                                        model_rarity.strip()
-                                        .replace("%", "")
-                                        .replace(",", ".")
+                                    # Get model info safely
+                                    model_info = nft.get("rarity", {}).get(
+                                        "Model", {}
                                     )
-                                    if rarity_text:
-                                        rarity_value = float(rarity_text)
-                                    else:
-                                        rarity_value = 100.0
-
-                                    # Check if this is a Neo Matrix model with required rarity
-                                    if (
-                                        model_name == "Neo Matrix"
-                                        and rarity_value <= 2.1
-                                        and nft["image_type"] == "tgs"
-                                    ):
-                                        filtered_nfts.append(nft)
-                                        logger.info(
-                                            f"Found qualifying Neo Matrix NFT with rarity {rarity_value}%"
-                                        )
-                                except Exception as e:
-                                    logger.error(
-                                        f"Error processing rarity for NFT {nft['id']}: {str(e)}"
+                                    model_name = model_info.get("value", "")
+                                    model_rarity = model_info.get(
+                                        "rarity", "100%"
                                     )
-                                continue
-
-                            # Prepare media group for Telegram (must be file_id or attach:// for new uploads)
-                            if filtered_nfts:
-                                logger.info(
-                                    f"Found {len(filtered_nfts)} NFTs that match Neo Matrix filtering criteria"
-                                )
-                                try:
-                                    # First download all stickers
-                                    media = []
-                                    files = {}
-
-                                    for idx, nft in enumerate(filtered_nfts):
-                                        try:
-                                            image_url = nft["image_url"]
-                                            async with httpx.AsyncClient() as client:
-                                                resp = await client.get(image_url)
-                                                if resp.status_code == 200:
-                                                    attach_name = f"file{idx}.tgs"
-                                                    files[attach_name] = resp.content
-
-                                                    # Get model info safely
-                                                    model_info = nft.get(
-                                                        "rarity", {}
-                                                    ).get("Model", {})
-                                                    model_name = model_info.get(
-                                                        "value", ""
-                                                    )
-                                                    model_rarity = model_info.get(
-                                                        "rarity", "100%"
-                                                    )
 
-                                                    # Create safe caption without potentially problematic characters
-                                                    caption = f"{nft['name']} {nft['full_id']}\nModel: {model_name}"
-                                                    if model_rarity:
-                                                        caption += (
-                                                            f" (Rarity: {model_rarity})"
-                                                        )
-
-                                                    media.append(
-                                                        {
-                                                            "type": "document",
-                                                            "media": f"attach://{attach_name}",
-                                                            "caption": caption,
-                                                        }
-                                                    )
-                                        except Exception as e:
-                                            logger.error(
-                                                f"Error preparing media for NFT {nft['id']}: {str(e)}"
-                                            )
+                                    # Create safe caption without potentially problematic characters
+                                    name = nft["name"]
+                                    full_id = nft["full_id"]
+                                    caption = f"{name} {full_id}\nModel: {model_name}"
+                                    if model_rarity:
+                                        caption += f" (Rarity: {model_rarity})"
+
+                                    media.append(
+                                        {
+                                            "type": "document",
+                                            "media": f"attach://{attach_name}",
+                                            "caption": caption,
+                                        }
+                                    )
 
-                                    # Now send the media
-                                    if media:
-                                        logger.info(
-                                            f"Sending {len(media)} Neo Matrix NFTs to Telegram"
+                                # Now send the media
+                                if media:
+                                    logger.info(
+                                        "Sending %s Neo Matrix NFTs to Telegram",
+                                        len(media),
+                                    )
+                                    if len(media) == 1:
+                                        # For single documents, use sendDocument
+                                        attach_name = "file0.tgs"
+                                        url = self._tg_send_doc_url
+                                        form = FormData()
+                                        form.add_field("chat_id", CHANNEL_ID)
+                                        form.add_field(
+                                            "caption", media[0]["caption"]
                                         )
-                                        if len(media) == 1:
-                                            # For single documents, use sendDocument
-                                            attach_name = "file0.tgs"
-                                            url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendDocument"
-                                            data = {
-                                                "chat_id": CHANNEL_ID,
-                                                "caption": media[0]["caption"],
-                                                "parse_mode": "HTML",
-                                            }
-                                            files_payload = {
-                                                "document": (
-                                                    attach_name,
-                                                    files[attach_name],
-                                                    "application/x-tgsticker",
-                                                )
-                                            }
-                                            async with httpx.AsyncClient() as client:
-                                                resp = await client.post(
-                                                    url, data=data, files=files_payload
-                                                )
-                                                logger.info(
-                                                    f"Telegram sendDocument status: {resp.status_code}, response: {resp.text}"
-                                                )
-                                        else:
-                                            # For multiple documents, use sendMediaGroup
-                                            url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMediaGroup"
-                                            data = {
-                                                "chat_id": CHANNEL_ID,
-                                                "media": json.dumps(media),
-                                            }
-                                            files_payload = {
-                                                name: (
-                                                    name,
-                                                    content,
-                                                    "application/x-tgsticker",
-                                                )
-                                                for name, content in files.items()
-                                            }
-                                            async with httpx.AsyncClient() as client:
-                                                resp = await client.post(
-                                                    url, data=data, files=files_payload
-                                                )
+                                        form.add_field("parse_mode", "HTML")
+                                        form.add_field(
+                                            "document",
+                                            files[attach_name],
+                                            filename=attach_name,
+                                            content_type="application/x-tgsticker",
+                                        )
+                                        async with session.post(
+                                            url, data=form
+                                        ) as resp:
+                                            # Decoding the body is only worth
+                                            # it if the log line is emitted
+                                            if logger.isEnabledFor(logging.INFO):
                                                 logger.info(
-                                                    f"Telegram sendMediaGroup status: {resp.status_code}, response: {resp.text}"
+                                                    "Telegram sendDocument status: %s, response: %s",
+                                                    resp.status,
+                                                    await resp.text(),
                                                 )
-                                except Exception as e:
-                                    logger.error(f"Error sending media group: {str(e)}")
-                                    # Try to send one by one if group send fails
-                                    logger.info(
-                                        "Attempting to send documents one by one..."
-                                    )
-                                    for idx, nft in enumerate(filtered_nfts):
-                                        try:
-                                            attach_name = f"file{idx}.tgs"
-                                            if attach_name in files:
-                                                url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendDocument"
-                                                data = {
-                                                    "chat_id": CHANNEL_ID,
-                                                    "caption": f"{nft['name']} {nft['full_id']}",
-                                                    "parse_mode": "HTML",
-                                                }
-                                                file_payload = {
-                                                    "document": (
-                                                        attach_name,
-                                                        files[attach_name],
-                                                        "application/x-tgsticker",
+                                    else:
+                                        # For multiple documents, use sendMediaGroup
+                                        # in chunks of 10 (Telegram's per-call cap)
+                                        url = self._tg_send_group_url
+                                        for start in range(0, len(media), 10):
+                                            chunk = media[start : start + 10]
+                                            form = FormData()
+                                            form.add_field("chat_id", CHANNEL_ID)
+                                            form.add_field(
+                                                "media",
+                                                orjson.dumps(chunk).decode(),
+                                            )
+                                            chunk_names = [
+                                                item["media"][len("attach://") :]
+                                                for item in chunk
+                                            ]
+                                            for name in chunk_names:
+                                                if name in files:
+                                                    form.add_field(
+                                                        name,
+                                                        files[name],
+                                                        filename=name,
+                                                        content_type="application/x-tgsticker",
                                                     )
-                                                }
-                                                async with (
-                                                    httpx.AsyncClient() as client
+                                            async with session.post(
+                                                url, data=form
+                                            ) as resp:
+                                                if logger.isEnabledFor(
+                                                    logging.INFO
                                                 ):
-                                                    resp = await client.post(
-                                                        url,
-                                                        data=data,
-                                                        files=file_payload,
-                                                    )
                                                     logger.info(
-                                                        f"Individual document send status: {resp.status_code}"
+                                                        "Telegram sendMediaGroup status: %s, response: %s",
+                                                        resp.status,
+                                                        await resp.text(),
                                                     )
-                                                await asyncio.sleep(
-                                                    1
-                                                )  # Short delay between sends
-                                        except Exception as inner_e:
-                                            logger.error(
-                                                f"Failed to send individual document: {str(inner_e)}"
-                                            )
+                            except Exception as e:
+                                logger.error("Error sending media group: %s", e)
+                                # Try to send one by one if group send fails;
+                                # the semaphore keeps the burst within
+                                # Telegram's limits without a fixed sleep
+                                logger.info(
+                                    "Attempting to send documents one by one..."
+                                )
+                                send_sem = asyncio.Semaphore(5)
+                                send_results = await asyncio.gather(
+                                    *(
+                                        self._send_single_document(
+                                            idx, nft, files, session, send_sem
+                                        )
+                                        for idx, nft in enumerate(filtered_nfts)
+                                    ),
+                                    return_exceptions=True,
+                                )
+                                for inner_e in send_results:
+                                    if isinstance(inner_e, Exception):
+                                        logger.error(
+                                            "Failed to send individual document: %s",
+                                            inner_e,
+                                        )
+                            finally:
+                                for buf in files.values():
+                                    buf.close()
                 else:
-                    # Slow down polling if nothing is found to avoid hammering the server
+                    # Slow down polling if nothing is found to avoid hammering
+                    # the server: back off exponentially (with jitter) while
+                    # idle instead of a fixed 5 seconds
                     logger.info(
-                        "No new NFTs found in this polling period. Waiting 5 seconds..."
+                        "No new NFTs found in this polling period. Waiting %.1f seconds...",
+                        self._idle_backoff,
                     )
-                    await asyncio.sleep(5)  # Rest longer when no NFTs are found
+                    await asyncio.sleep(self._idle_backoff)
+                    self._idle_backoff = min(
+                        self._idle_backoff * 1.5, 60
+                    ) + random.uniform(0, 1)
 
         except KeyboardInterrupt:
             logger.info("Monitoring stopped by user.")
@@ -932,13 +1375,9 @@ class NFTScanner:
 
     def alert_new_nft(self, nft_data):
         """Make a sound and visual alert when a new NFT is found"""
-        # Make a terminal beep sound (ASCII bell character)
-        print("\a", flush=True)
-
-        # For more visibility, print a special message with multiple beeps
-        for _ in range(3):
-            print("\a", end="", flush=True)
-            time.sleep(0.3)
+        # Make a terminal beep sound (ASCII bell characters); emitted in one
+        # write so the async caller isn't blocked by sleeps between beeps
+        print("\a\a\a\a", flush=True)
 
         # Print a colorful message with rarity information
         print("\n" + "=" * 60)
@@ -968,7 +1407,7 @@ class NFTScanner:
                     rarity_str = f" ({info['rarity']})" if info["rarity"] else ""
                     print(f"   - {prop}: {info['value']}{rarity_str}")
 
-        print(f"\nImages saved to: {os.path.abspath(self.output_dir)}")
+        print(f"\nImages saved to: {self._output_abs}")
         print("==============================\n")
 
 
@@ -1009,11 +1448,17 @@ async def main():
         action="store_true",
         help="Always respect saved IDs and skip binary search when IDs are loaded from file",
     )
+    parser.add_argument(
+        "--max-rate",
+        type=int,
+        default=10,
+        help="Maximum requests per second to t.me (default: 10)",
+    )
     args = parser.parse_args()
 
     # In Docker environments, we always want to respect saved IDs
     # This ensures continuity between container restarts
-    if os.path.exists("/app/data"):
+    if IS_DOCKER:
         args.respect_saved = True
         logger.info("Docker environment detected, enabling --respect-saved option")
 
@@ -1026,8 +1471,10 @@ async def main():
         check_interval=args.interval,
         gift_name=args.gift_name,
         respect_saved=args.respect_saved,
+        max_rate=args.max_rate,
     )
-    await scanner.scan()
+    async with scanner:
+        await scanner.scan()
 
 
 if __name__ == "__main__":
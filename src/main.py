@@ -15,6 +15,16 @@ from src.nft_scanner.config import Config
 from src.nft_scanner.core import NFTScanner
 from src.nft_scanner.utils import setup_logger
 
+# uvloop cuts event-loop overhead on the socket-heavy scan/monitor paths;
+# it is POSIX-only, so fall back to the default loop elsewhere
+if sys.platform != "win32":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
 logger = setup_logger()
 
 
@@ -1,18 +1,44 @@
 """Telegram API client for sending NFT notifications."""
 
+import asyncio
+import tempfile
 from typing import Dict, List
 
 import httpx
+import orjson
+from aiolimiter import AsyncLimiter
+
+# HTTP/2 lets concurrent uploads multiplex over one TLS session, but httpx
+# needs the optional h2 package for it; fall back to HTTP/1.1 without it
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
 from src.nft_scanner.models import NFT
 from src.nft_scanner.utils import setup_logger
 
 logger = setup_logger("telegram-client")
 
+# Single-pass translation table for HTML escaping; three chained
+# str.replace calls each copy the whole string
+_HTML_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# Pre-serialized bodies go out via content=, bypassing the stdlib json
+# encoder httpx would otherwise run per call
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class TelegramClient:
     """Client for sending Telegram notifications about NFTs."""
 
+    # Invariant message headers, created once instead of per notification;
+    # the "\n".join at the render site supplies the separating newline
+    _SINGLE_HEADER = "<b>New NFT found:</b>"
+    _BATCH_HEADER = "<b>New NFTs found:</b>"
+
     def __init__(self, bot_token: str, channel_id: str):
         """
         Initialize the Telegram client.
@@ -23,7 +49,112 @@ class TelegramClient:
         """
         self.bot_token = bot_token
         self.channel_id = channel_id
+        # Built once; every send posts a relative path ("/sendMessage",
+        # "/sendDocument", ...) against this base URL instead of
+        # reassembling the full endpoint per call
         self.api_url = f"https://api.telegram.org/bot{bot_token}"
+        # One pooled client for every send; a per-call client pays a fresh
+        # TCP+TLS handshake to api.telegram.org on each notification
+        self._client = httpx.AsyncClient(
+            base_url=self.api_url,
+            timeout=30.0,
+            http2=_HTTP2,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+        # Telegram allows ~30 messages/second per bot and ~1/second per
+        # chat; staying under both avoids 429 stalls on bursty batches
+        self._global_limiter = AsyncLimiter(30, 1)
+        self._chat_limiter = AsyncLimiter(1, 1)
+        # Cap parallel sticker downloads so a large batch does not flood
+        # the image CDN with one socket per file and trip its 429s
+        self._download_sem = asyncio.Semaphore(8)
+        # Notification batching: enqueued NFTs are coalesced into a single
+        # message once a batch fills or the flush window elapses
+        self._batch_queue: asyncio.Queue = asyncio.Queue()
+        self._batcher_task = None
+        self._max_batch_size = 10
+        self._max_wait_time = 0.5
+
+    async def enqueue_nft(self, nft: NFT) -> None:
+        """
+        Queue an NFT for a batched notification.
+
+        NFTs enqueued within the flush window are sent as one message via
+        send_batch_notification instead of one request each, keeping bursts
+        well under the Bot API message ceiling.
+
+        Args:
+            nft: NFT to include in the next batched notification
+        """
+        if self._batcher_task is None:
+            self._batcher_task = asyncio.create_task(self._batch_sender())
+        await self._batch_queue.put(nft)
+
+    async def _batch_sender(self) -> None:
+        """Drain the queue into batched notifications in the background."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + self._max_wait_time
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._batch_queue.get(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self.send_batch_notification(batch)
+            finally:
+                for _ in batch:
+                    self._batch_queue.task_done()
+
+    async def _limited_post(self, path: str, **kwargs) -> httpx.Response:
+        """
+        POST to the Bot API within the rate limits, retrying once on a 429.
+
+        Args:
+            path: Endpoint path relative to the bot API base URL
+            **kwargs: Passed through to the underlying client.post call
+
+        Returns:
+            The final httpx response
+        """
+        async with self._global_limiter, self._chat_limiter:
+            resp = await self._client.post(path, **kwargs)
+
+        if resp.status_code == 429:
+            try:
+                retry_after = resp.json().get("parameters", {}).get("retry_after", 1)
+            except Exception:
+                retry_after = 1
+            logger.warning(f"Telegram throttled {path}, retrying in {retry_after}s")
+            await asyncio.sleep(retry_after)
+            # Rewind any file-like multipart payloads before re-posting;
+            # the first attempt left them at EOF
+            for item in (kwargs.get("files") or {}).values():
+                fileobj = item[1] if isinstance(item, tuple) else item
+                if hasattr(fileobj, "seek"):
+                    fileobj.seek(0)
+            async with self._global_limiter, self._chat_limiter:
+                resp = await self._client.post(path, **kwargs)
+
+        return resp
+
+    async def aclose(self):
+        """Flush pending notifications and close the pooled HTTP client."""
+        if self._batcher_task is not None:
+            await self._batch_queue.join()
+            self._batcher_task.cancel()
+            try:
+                await self._batcher_task
+            except asyncio.CancelledError:
+                pass
+            self._batcher_task = None
+        await self._client.aclose()
 
     async def send_message(self, text: str, parse_mode: str = "HTML") -> bool:
         """
@@ -36,28 +167,28 @@ class TelegramClient:
         Returns:
             True if the message was sent successfully, False otherwise
         """
-        url = f"{self.api_url}/sendMessage"
         payload = {"chat_id": self.channel_id, "text": text, "parse_mode": parse_mode}
 
         logger.info(f"Sending message to Telegram channel {self.channel_id}")
 
-        async with httpx.AsyncClient() as client:
-            try:
-                resp = await client.post(url, json=payload)
-                logger.info(
-                    f"Telegram send_message status: {resp.status_code}, text length: {len(text)}"
-                )
-
-                if resp.status_code != 200:
-                    logger.error(f"Failed to send message: {resp.text}")
-                    return False
+        try:
+            resp = await self._limited_post(
+                "/sendMessage", content=orjson.dumps(payload), headers=_JSON_HEADERS
+            )
+            logger.info(
+                f"Telegram send_message status: {resp.status_code}, text length: {len(text)}"
+            )
 
-                logger.info("Successfully sent message to Telegram")
-                return True
-            except Exception as e:
-                logger.error(f"Error sending message to Telegram: {str(e)}")
+            if resp.status_code != 200:
+                logger.error(f"Failed to send message: {resp.text}")
                 return False
 
+            logger.info("Successfully sent message to Telegram")
+            return True
+        except Exception as e:
+            logger.error(f"Error sending message to Telegram: {str(e)}")
+            return False
+
     async def send_document(
         self, file_bytes: bytes, filename: str, caption: str
     ) -> bool:
@@ -72,22 +203,20 @@ class TelegramClient:
         Returns:
             True if the document was sent successfully, False otherwise
         """
-        url = f"{self.api_url}/sendDocument"
         files = {"document": (filename, file_bytes, "application/x-tgsticker")}
         data = {"chat_id": self.channel_id, "caption": caption}
 
-        async with httpx.AsyncClient() as client:
-            try:
-                resp = await client.post(url, data=data, files=files)
-                logger.info(f"Telegram send_document status: {resp.status_code}")
+        try:
+            resp = await self._limited_post("/sendDocument", data=data, files=files)
+            logger.info(f"Telegram send_document status: {resp.status_code}")
 
-                if resp.status_code != 200:
-                    logger.error(f"Failed to send document: {resp.text}")
-                    return False
-                return True
-            except Exception as e:
-                logger.error(f"Error sending document: {str(e)}")
+            if resp.status_code != 200:
+                logger.error(f"Failed to send document: {resp.text}")
                 return False
+            return True
+        except Exception as e:
+            logger.error(f"Error sending document: {str(e)}")
+            return False
 
     async def send_media_group(self, media: List[Dict]) -> bool:
         """
@@ -99,21 +228,21 @@ class TelegramClient:
         Returns:
             True if the media group was sent successfully, False otherwise
         """
-        url = f"{self.api_url}/sendMediaGroup"
         data = {"chat_id": self.channel_id, "media": media}
 
-        async with httpx.AsyncClient() as client:
-            try:
-                resp = await client.post(url, json=data)
-                logger.info(f"Telegram sendMediaGroup status: {resp.status_code}")
+        try:
+            resp = await self._limited_post(
+                "/sendMediaGroup", content=orjson.dumps(data), headers=_JSON_HEADERS
+            )
+            logger.info(f"Telegram sendMediaGroup status: {resp.status_code}")
 
-                if resp.status_code != 200:
-                    logger.error(f"Failed to send media group: {resp.text}")
-                    return False
-                return True
-            except Exception as e:
-                logger.error(f"Error sending media group: {str(e)}")
+            if resp.status_code != 200:
+                logger.error(f"Failed to send media group: {resp.text}")
                 return False
+            return True
+        except Exception as e:
+            logger.error(f"Error sending media group: {str(e)}")
+            return False
 
     def _escape_html(self, text: str) -> str:
         """
@@ -125,7 +254,31 @@ class TelegramClient:
         Returns:
             Escaped text
         """
-        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        return text.translate(_HTML_TABLE)
+
+    @staticmethod
+    def _parse_model_rarity(nft: NFT):
+        """
+        Return the NFT's cached model rarity with its name and raw string.
+
+        The float itself lives on NFT.model_rarity_pct, parsed once per
+        NFT lifetime; this just pairs it with the model metadata the
+        rendering paths need.
+
+        Args:
+            nft: NFT to look up
+
+        Returns:
+            Tuple of (rarity value or None, model name, raw rarity string)
+        """
+        model_info = nft.rarity.get("Model") if nft.rarity else None
+        if not model_info:
+            return None, "", ""
+        return (
+            nft.model_rarity_pct,
+            model_info.get("value", ""),
+            model_info.get("rarity", ""),
+        )
 
     def _is_model_super_rare(self, nft: NFT) -> bool:
         """
@@ -137,22 +290,8 @@ class TelegramClient:
         Returns:
             True if the model is super rare, False otherwise
         """
-        if not nft.rarity or "Model" not in nft.rarity:
-            return False
-
-        model_info = nft.rarity["Model"]
-        model_rarity = model_info.get("rarity")
-
-        if not model_rarity:
-            return False
-
-        try:
-            rarity_value = float(
-                model_rarity.strip().replace("%", "").replace(",", ".")
-            )
-            return rarity_value < 0.6
-        except (ValueError, TypeError):
-            return False
+        pct = nft.model_rarity_pct
+        return pct is not None and pct < 0.6
 
     def _is_model_rare(self, nft: NFT) -> bool:
         """
@@ -164,22 +303,8 @@ class TelegramClient:
         Returns:
             True if the model is rare, False otherwise
         """
-        if not nft.rarity or "Model" not in nft.rarity:
-            return False
-
-        model_info = nft.rarity["Model"]
-        model_rarity = model_info.get("rarity")
-
-        if not model_rarity:
-            return False
-
-        try:
-            rarity_value = float(
-                model_rarity.strip().replace("%", "").replace(",", ".")
-            )
-            return 0.6 <= rarity_value < 1.8
-        except (ValueError, TypeError):
-            return False
+        pct = nft.model_rarity_pct
+        return pct is not None and 0.6 <= pct < 1.8
 
     def _get_model_rarity_tag(self, nft: NFT) -> str:
         """
@@ -191,15 +316,12 @@ class TelegramClient:
         Returns:
             Rarity tag or empty string
         """
-        if self._is_model_super_rare(nft):
-            model_info = nft.rarity["Model"]
-            model_name = model_info.get("value", "")
-            model_rarity = model_info.get("rarity", "")
+        rarity_value, model_name, model_rarity = self._parse_model_rarity(nft)
+        if rarity_value is None:
+            return ""
+        if rarity_value < 0.6:
             return f" #super_rare (Model: {model_name} {model_rarity})"
-        elif self._is_model_rare(nft):
-            model_info = nft.rarity["Model"]
-            model_name = model_info.get("value", "")
-            model_rarity = model_info.get("rarity", "")
+        if rarity_value < 1.8:
             return f" #rare (Model: {model_name} {model_rarity})"
         return ""
 
@@ -219,22 +341,24 @@ class TelegramClient:
         # Add super_rare tag if applicable (only based on model rarity)
         super_rare_tag = self._get_model_rarity_tag(nft)
 
-        message = (
-            f"<b>New NFT found:</b>\n"
+        # Collect lines and join once; repeated += re-copies the message
+        # for every rarity property
+        parts = [
+            self._SINGLE_HEADER,
             f"<a href='{nft.url}'>"
-            f"<code>{safe_name}</code> {nft.full_id}</a>{super_rare_tag}"
-        )
+            f"<code>{safe_name}</code> {nft.full_id}</a>{super_rare_tag}",
+        ]
 
         # Add rarity information if available
         if nft.rarity:
-            message += "\n\n<b>Rarity Information:</b>"
+            parts.append("\n<b>Rarity Information:</b>")
             for prop, info in nft.rarity.items():
                 # Escape property values as well
                 safe_value = self._escape_html(info["value"])
                 rarity_str = f" ({info['rarity']})" if info["rarity"] else ""
-                message += f"\n• {prop}: <code>{safe_value}</code>{rarity_str}"
+                parts.append(f"• {prop}: <code>{safe_value}</code>{rarity_str}")
 
-        return await self.send_message(message)
+        return await self.send_message("\n".join(parts))
 
     async def send_batch_notification(self, nfts: List[NFT]) -> bool:
         """
@@ -274,7 +398,7 @@ class TelegramClient:
                 f"<code>{safe_name}</code> {nft.full_id}</a>{super_rare_tag}"
             )
 
-        message = "<b>New NFTs found:</b>\n" + "\n".join(links)
+        message = "\n".join([self._BATCH_HEADER, *links])
         logger.info(f"Created batch message with {len(links)} links")
         return await self.send_message(message)
 
@@ -292,50 +416,53 @@ class TelegramClient:
         Returns:
             True if at least one sticker was sent successfully, False otherwise
         """
-        # Filter for specific model and rarity
-        filtered_nfts = []
-        for nft in nfts:
-            try:
-                # Get model info
-                if not nft.rarity or "Model" not in nft.rarity:
-                    continue
-
-                model_info = nft.rarity["Model"]
-                model_name_value = model_info.get("value", "")
-                model_rarity = model_info.get("rarity", "100%")
-
-                # Clean and parse the rarity value
-                rarity_text = model_rarity.strip().replace("%", "").replace(",", ".")
-                if not rarity_text:
-                    continue
-
-                rarity_value = float(rarity_text)
-
-                # Check if this is the specified model with required rarity
-                if (
-                    model_name_value == model_name
-                    and rarity_value <= max_rarity
-                    and nft.image_type == "tgs"
-                ):
-                    filtered_nfts.append(nft)
-                    rarity_label = (
-                        "super rare"
-                        if rarity_value <= 0.6
-                        else "rare"
-                        if rarity_value <= 1.8
-                        else "uncommon"
-                    )
-                    logger.info(
-                        f"Found qualifying {model_name} NFT ({rarity_label}) with rarity {rarity_value}%"
-                    )
-            except Exception as e:
-                logger.error(f"Error processing rarity for NFT {nft.id}: {str(e)}")
+        # Filter in a single pass; the predicate hands back the parsed
+        # rarity so the log label below reuses it without re-parsing
+        filtered = [
+            (nft, rarity)
+            for nft in nfts
+            if (rarity := self._qualifies(nft, model_name, max_rarity)) is not None
+        ]
+
+        for nft, rarity_value in filtered:
+            rarity_label = (
+                "super rare"
+                if rarity_value <= 0.6
+                else "rare"
+                if rarity_value <= 1.8
+                else "uncommon"
+            )
+            logger.info(
+                f"Found qualifying {model_name} NFT ({rarity_label}) with rarity {rarity_value}%"
+            )
 
-        if not filtered_nfts:
+        if not filtered:
             return False
 
         # Download all stickers and prepare media array
-        return await self._send_filtered_stickers(filtered_nfts)
+        return await self._send_filtered_stickers([nft for nft, _ in filtered])
+
+    def _qualifies(self, nft: NFT, model_name: str, max_rarity: float):
+        """
+        Return the parsed model rarity if the NFT matches the sticker filter.
+
+        Args:
+            nft: NFT to test
+            model_name: Model name to filter for
+            max_rarity: Maximum rarity value to include
+
+        Returns:
+            The rarity value when the NFT qualifies, None otherwise
+        """
+        rarity_value, model_name_value, _ = self._parse_model_rarity(nft)
+        if (
+            rarity_value is not None
+            and model_name_value == model_name
+            and rarity_value <= max_rarity
+            and nft.image_type == "tgs"
+        ):
+            return rarity_value
+        return None
 
     async def _send_filtered_stickers(self, nfts: List[NFT]) -> bool:
         """
@@ -347,42 +474,79 @@ class TelegramClient:
         Returns:
             True if at least one sticker was sent successfully, False otherwise
         """
-        # First download all stickers
+        # Download all stickers concurrently; the batch then costs roughly
+        # one round trip instead of one per sticker
         media = []
         files = {}
 
-        for idx, nft in enumerate(nfts):
-            try:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.get(nft.image_url)
-                    if resp.status_code == 200:
-                        attach_name = f"file{idx}.tgs"
-                        files[attach_name] = resp.content
-
-                        # Get model info safely
-                        model_info = nft.rarity.get("Model", {})
-                        model_name_value = model_info.get("value", "")
-                        model_rarity = model_info.get("rarity", "100%")
-
-                        # Create safe caption
-                        caption = f"{nft.name} {nft.full_id}\nModel: {model_name_value}"
-                        if model_rarity:
-                            caption += f" (Rarity: {model_rarity})"
-
-                        media.append(
-                            {
-                                "type": "document",
-                                "media": f"attach://{attach_name}",
-                                "caption": caption,
-                            }
-                        )
-            except Exception as e:
-                logger.error(f"Error preparing media for NFT {nft.id}: {str(e)}")
+        buffers = await asyncio.gather(
+            *(self._download_sticker(nft) for nft in nfts),
+            return_exceptions=True,
+        )
+
+        for idx, (nft, buf) in enumerate(zip(nfts, buffers)):
+            if isinstance(buf, Exception):
+                logger.error(f"Error preparing media for NFT {nft.id}: {str(buf)}")
+                continue
+            if buf is None:
+                continue
+
+            attach_name = f"file{idx}.tgs"
+            files[attach_name] = buf
+
+            # Get model info safely
+            model_info = nft.rarity.get("Model", {})
+            model_name_value = model_info.get("value", "")
+            model_rarity = model_info.get("rarity", "100%")
+
+            # Create safe caption
+            caption = f"{nft.name} {nft.full_id}\nModel: {model_name_value}"
+            if model_rarity:
+                caption += f" (Rarity: {model_rarity})"
+
+            media.append(
+                {
+                    "type": "document",
+                    "media": f"attach://{attach_name}",
+                    "caption": caption,
+                }
+            )
 
         if not media:
+            for buf in files.values():
+                buf.close()
             return False
 
-        return await self._send_media_files(media, files, nfts)
+        try:
+            return await self._send_media_files(media, files, nfts)
+        finally:
+            for buf in files.values():
+                buf.close()
+
+    async def _download_sticker(self, nft: NFT):
+        """
+        Stream one sticker download into a spooled temporary file.
+
+        Buffering resp.content keeps every sticker of a batch fully in
+        memory at once; spooled files overflow to disk past 512KB so peak
+        RSS stays near one sticker regardless of batch size.
+
+        Args:
+            nft: NFT whose image to download
+
+        Returns:
+            A rewound file object, or None if the download failed
+        """
+        buf = tempfile.SpooledTemporaryFile(max_size=512_000)
+        async with self._download_sem:
+            async with self._client.stream("GET", nft.image_url) as resp:
+                if resp.status_code != 200:
+                    buf.close()
+                    return None
+                async for chunk in resp.aiter_bytes():
+                    buf.write(chunk)
+        buf.seek(0)
+        return buf
 
     async def _send_media_files(
         self, media: List[Dict], files: Dict, nfts: List[NFT]
@@ -406,7 +570,6 @@ class TelegramClient:
             if len(media) == 1:
                 # For single documents, use sendDocument
                 attach_name = "file0.tgs"
-                url = f"https://api.telegram.org/bot{self.bot_token}/sendDocument"
                 data = {
                     "chat_id": self.channel_id,
                     "caption": media[0]["caption"],
@@ -419,25 +582,39 @@ class TelegramClient:
                         "application/x-tgsticker",
                     )
                 }
-                async with httpx.AsyncClient() as client:
-                    resp = await client.post(url, data=data, files=files_payload)
-                    logger.info(f"Telegram sendDocument status: {resp.status_code}")
-                    return resp.status_code == 200
+                resp = await self._limited_post(
+                    "/sendDocument", data=data, files=files_payload
+                )
+                logger.info(f"Telegram sendDocument status: {resp.status_code}")
+                return resp.status_code == 200
             else:
-                # For multiple documents, use sendMediaGroup
-                url = f"https://api.telegram.org/bot{self.bot_token}/sendMediaGroup"
-                data = {
-                    "chat_id": self.channel_id,
-                    "media": media,
-                }
-                files_payload = {
-                    name: (name, content, "application/x-tgsticker")
-                    for name, content in files.items()
-                }
-                async with httpx.AsyncClient() as client:
-                    resp = await client.post(url, data=data, files=files_payload)
+                # For multiple documents, use sendMediaGroup; Telegram caps
+                # a media group at 10 items, so chunk and dispatch the
+                # chunks concurrently on the shared client
+                async def send_chunk(chunk: List[Dict]) -> bool:
+                    data = {
+                        "chat_id": self.channel_id,
+                        # Multipart form fields must be strings; orjson does
+                        # the encoding in one C-level pass
+                        "media": orjson.dumps(chunk).decode(),
+                    }
+                    files_payload = {
+                        name: (name, files[name], "application/x-tgsticker")
+                        for name in (
+                            item["media"].removeprefix("attach://")
+                            for item in chunk
+                        )
+                    }
+                    resp = await self._limited_post(
+                        "/sendMediaGroup", data=data, files=files_payload
+                    )
                     logger.info(f"Telegram sendMediaGroup status: {resp.status_code}")
                     return resp.status_code == 200
+
+                results = await asyncio.gather(
+                    *(send_chunk(media[i : i + 10]) for i in range(0, len(media), 10))
+                )
+                return all(results)
         except Exception as e:
             logger.error(f"Error sending media group: {str(e)}")
             return await self._send_files_individually(nfts, files)
@@ -453,35 +630,49 @@ class TelegramClient:
         Returns:
             True if at least one file was sent successfully, False otherwise
         """
-        # Try to send one by one if group send fails
-        success = False
+        # Dispatch the per-file sends together; the per-chat limiter in
+        # _limited_post paces them, so recovery runs at Telegram's rate
+        # floor instead of one round trip per file on top of it
         logger.info("Attempting to send documents one by one...")
 
-        for idx, nft in enumerate(nfts):
-            try:
-                attach_name = f"file{idx}.tgs"
-                if attach_name in files:
-                    url = f"https://api.telegram.org/bot{self.bot_token}/sendDocument"
-                    data = {
-                        "chat_id": self.channel_id,
-                        "caption": f"{nft.name} {nft.full_id}",
-                        "parse_mode": "HTML",
-                    }
-                    file_payload = {
-                        "document": (
-                            attach_name,
-                            files[attach_name],
-                            "application/x-tgsticker",
-                        )
-                    }
-                    async with httpx.AsyncClient() as client:
-                        resp = await client.post(url, data=data, files=file_payload)
-                        if resp.status_code == 200:
-                            success = True
-                        logger.info(
-                            f"Individual document send status: {resp.status_code}"
-                        )
-            except Exception as inner_e:
-                logger.error(f"Failed to send individual document: {str(inner_e)}")
+        results = await asyncio.gather(
+            *(
+                self._send_one_document(nft, f"file{idx}.tgs", files[f"file{idx}.tgs"])
+                for idx, nft in enumerate(nfts)
+                if f"file{idx}.tgs" in files
+            ),
+            return_exceptions=True,
+        )
+        return any(result is True for result in results)
+
+    async def _send_one_document(self, nft: NFT, attach_name: str, fileobj) -> bool:
+        """
+        Send a single sticker document through the rate-limited client.
 
-        return success
+        Args:
+            nft: NFT the document belongs to
+            attach_name: Filename to attach the document under
+            fileobj: File object or bytes with the document contents
+
+        Returns:
+            True if the document was sent successfully, False otherwise
+        """
+        try:
+            if hasattr(fileobj, "seek"):
+                fileobj.seek(0)
+            data = {
+                "chat_id": self.channel_id,
+                "caption": f"{nft.name} {nft.full_id}",
+                "parse_mode": "HTML",
+            }
+            file_payload = {
+                "document": (attach_name, fileobj, "application/x-tgsticker")
+            }
+            resp = await self._limited_post(
+                "/sendDocument", data=data, files=file_payload
+            )
+            logger.info(f"Individual document send status: {resp.status_code}")
+            return resp.status_code == 200
+        except Exception as inner_e:
+            logger.error(f"Failed to send individual document: {str(inner_e)}")
+            return False
@@ -2,10 +2,17 @@
 
 import argparse
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from environs import Env
 
+# Evaluated once at import; whether we run inside the Docker data volume
+# does not change mid-process, so steady-state code must not re-stat it
+_DOCKER = os.path.exists("/app/data")
+
+# Parsed once on first use so re-reading config never re-reads .env
+_ENV_CONFIG = None
+
 
 @dataclass
 class Config:
@@ -31,26 +38,34 @@ class Config:
         """
         Load configuration from environment variables.
 
+        The .env file is only read on the first call; later calls copy
+        the already-parsed configuration. Each caller gets its own
+        instance, so mutating one (as from_args does with CLI overrides)
+        never leaks into another.
+
         Returns:
             Config object with values loaded from environment
         """
-        env = Env()
-        env.read_env()  # Read from .env file if it exists
-
-        return cls(
-            bot_token=env.str("TELEGRAM_BOT_TOKEN"),
-            channel_id=env.str("TELEGRAM_CHANNEL_ID"),
-            # Optional environment variables with defaults
-            start_id=env.int("NFT_START_ID", 245),
-            max_nfts=env.int("NFT_MAX_COUNT", 20),
-            output_dir=env.str("NFT_OUTPUT_DIR", "nft_images"),
-            find_latest=env.bool("NFT_FIND_LATEST", False),
-            monitor=env.bool("NFT_MONITOR", False),
-            check_interval=env.int("NFT_CHECK_INTERVAL", 5),
-            gift_name=env.str("NFT_GIFT_NAME", "SnakeBox"),
-            respect_saved=env.bool("NFT_RESPECT_SAVED", False),
-            data_dir=env.str("NFT_DATA_DIR", "./data"),
-        )
+        global _ENV_CONFIG
+        if _ENV_CONFIG is None:
+            env = Env()
+            env.read_env()  # Read from .env file if it exists
+
+            _ENV_CONFIG = cls(
+                bot_token=env.str("TELEGRAM_BOT_TOKEN"),
+                channel_id=env.str("TELEGRAM_CHANNEL_ID"),
+                # Optional environment variables with defaults
+                start_id=env.int("NFT_START_ID", 245),
+                max_nfts=env.int("NFT_MAX_COUNT", 20),
+                output_dir=env.str("NFT_OUTPUT_DIR", "nft_images"),
+                find_latest=env.bool("NFT_FIND_LATEST", False),
+                monitor=env.bool("NFT_MONITOR", False),
+                check_interval=env.int("NFT_CHECK_INTERVAL", 5),
+                gift_name=env.str("NFT_GIFT_NAME", "SnakeBox"),
+                respect_saved=env.bool("NFT_RESPECT_SAVED", False),
+                data_dir=env.str("NFT_DATA_DIR", "./data"),
+            )
+        return replace(_ENV_CONFIG)
 
     @classmethod
     def from_args(cls) -> "Config":
@@ -122,7 +137,7 @@ class Config:
 
         # In Docker environments, we always want to respect saved IDs
         # This ensures continuity between container restarts
-        if os.path.exists("/app/data"):
+        if _DOCKER:
             config.respect_saved = True
             print("Docker environment detected, enabling --respect-saved option")
 
@@ -2,13 +2,23 @@
 
 import os
 import asyncio
+import re
 import time
-from collections import deque
+from collections import OrderedDict, deque
 from typing import Optional
 
-from aiohttp import ClientSession, ClientTimeout
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
-from src.nft_scanner.models import NFT
+# HTTP caching lets repeat GETs for the same page (verify after binary
+# search, re-checks while monitoring) be served or revalidated locally;
+# scanning works identically without the optional backend
+try:
+    from aiohttp_client_cache import CachedSession, SQLiteBackend
+except ImportError:
+    CachedSession = None
+    SQLiteBackend = None
+
+from src.nft_scanner.models import NFT, parse_rarity
 from src.nft_scanner.utils import setup_logger, parse_nft_page, ImageHandler
 from src.nft_scanner.clients import TelegramClient
 from src.nft_scanner.storage import StateManager
@@ -20,6 +30,11 @@ logger = setup_logger("nft-scanner")
 class NFTScanner:
     """Main scanner class for finding and downloading NFTs."""
 
+    # How long a 404 is remembered before the ID is probed again, and how
+    # many missing IDs are kept before the oldest entries are evicted
+    _MISS_TTL = 30.0
+    _MISS_CACHE_MAX = 1024
+
     def __init__(
         self,
         bot_token: str,
@@ -56,12 +71,40 @@ class NFTScanner:
         self.output_dir = output_dir
         self.gift_name = gift_name
         self.base_url = "https://t.me/nft/"
+        # Constant prefix of every probe URL; built once instead of via an
+        # f-string per request in the hottest async path
+        self._url_prefix = self.base_url + gift_name + "-"
         self.found_nfts = deque(maxlen=max_nfts)
         self.find_latest = find_latest
         self.monitor = monitor
         self.check_interval = check_interval
         self.timeout = ClientTimeout(total=5)  # 5 second timeout for requests
         self.respect_saved = respect_saved
+        # Bound on concurrent page probes; scanning dispatches a window of
+        # IDs at once instead of awaiting them one by one
+        self._check_sem = asyncio.Semaphore(8)
+        self.scan_window = 10
+        # Recently-missing IDs; monitor cycles re-ask about the same
+        # not-yet-minted IDs, so a short negative cache skips those probes
+        self._miss_cache = OrderedDict()
+        # Idle delay between empty monitor cycles; doubles up to 60s while
+        # nothing is minted and snaps back to the floor on any find
+        self._idle_backoff = 5.0
+        # Running maximum of every NFT ID appended to found_nfts; avoids
+        # re-scanning the deque each time the highest ID is needed
+        self._max_seen_id = 0
+        # Highest ID awaiting persistence; the monitor's background
+        # flusher writes it at most once per interval instead of hitting
+        # disk on every cycle with a find
+        self._pending_save_id = None
+        # NFT pages carry an og:title meta naming the gift; scanning the
+        # page prefix for it is far cheaper than a full HTML parse when
+        # only existence matters
+        self._nft_marker_re = re.compile(
+            rb'og:title[^>]+content="' + re.escape(gift_name.encode()) + rb" #"
+        )
+
+        self.data_dir = data_dir
 
         # Create components
         self.telegram = TelegramClient(bot_token, channel_id)
@@ -89,6 +132,37 @@ class NFTScanner:
             f"Initialized scanner for {self.gift_name} with ID: {self.current_id}"
         )
 
+    def _make_session(self) -> ClientSession:
+        """
+        Build the HTTP session used for scanning.
+
+        Uses a cache-aware session when aiohttp_client_cache is installed
+        so unchanged pages revalidate via ETag instead of refetching; falls
+        back to a plain ClientSession otherwise.
+
+        Returns:
+            The session to scan with
+        """
+        # Bounded concurrency replaces the old fixed sleeps: the probe
+        # semaphore plus these connector caps keep the request rate polite.
+        # Long keepalive and DNS TTL let connections survive the idle gaps
+        # between monitor cycles instead of re-handshaking TLS each time
+        connector = TCPConnector(
+            limit=32,
+            limit_per_host=16,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        )
+        if CachedSession is not None:
+            cache = SQLiteBackend(
+                os.path.join(self.data_dir, "http_cache.sqlite"),
+                expire_after=60,
+            )
+            return CachedSession(
+                cache=cache, timeout=self.timeout, connector=connector
+            )
+        return ClientSession(timeout=self.timeout, connector=connector)
+
     def _load_last_id(self):
         """Load the last processed NFT ID from file."""
         next_id, loaded = self.state_manager.load_last_id(self.current_id)
@@ -99,7 +173,9 @@ class NFTScanner:
         """Save the last processed NFT ID to file."""
         self.state_manager.save_last_id(last_id)
 
-    async def find_latest_nft_id(self, session: ClientSession) -> int:
+    async def find_latest_nft_id(
+        self, session: ClientSession
+    ) -> tuple[int, bool]:
         """
         Use a binary search-like approach to quickly find the latest NFT ID.
 
@@ -107,7 +183,8 @@ class NFTScanner:
             session: ClientSession to use for requests
 
         Returns:
-            Latest NFT ID
+            Tuple of (latest NFT ID, whether content verification
+            confirmed the page is a real NFT page)
         """
         logger.info("Finding the latest NFT ID using accelerated search...")
 
@@ -119,10 +196,17 @@ class NFTScanner:
         # First phase: gradually increase ID with conservative step sizes
         for step in initial_steps:
             found_upper_bound = False
-            for _ in range(5):  # Try at most 5 jumps per step size
-                test_id = current_id + step
-                exists = await self._nft_exists_with_content_check(test_id, session)
+            # Fire all 5 jump candidates for this step size as one batch
+            # rather than awaiting each probe in turn
+            candidates = [current_id + step * (i + 1) for i in range(5)]
+            results = await asyncio.gather(
+                *(
+                    self._nft_exists_head(candidate, session)
+                    for candidate in candidates
+                )
+            )
 
+            for test_id, exists in zip(candidates, results):
                 if exists:
                     logger.info(f"ID {test_id} exists, jumping by {step}")
                     current_id = test_id
@@ -139,13 +223,13 @@ class NFTScanner:
 
         # If we didn't find any valid ID in the first phase, check if the start_id is valid
         if last_valid_id is None:
-            exists = await self._nft_exists_with_content_check(current_id, session)
+            exists = await self._nft_exists_head(current_id, session)
             if exists:
                 last_valid_id = current_id
             else:
                 # No valid IDs found
                 logger.warning(f"No valid NFTs found starting from ID {self.start_id}")
-                return self.start_id
+                return self.start_id, None
 
         # Second phase: binary search between last valid and first invalid
         upper_bound = current_id + step  # The first ID we know doesn't exist
@@ -157,7 +241,7 @@ class NFTScanner:
             mid = lower_bound + (upper_bound - lower_bound) // 2
             logger.info(f"Testing ID {mid} (range {lower_bound}-{upper_bound})")
 
-            exists = await self._nft_exists_with_content_check(mid, session)
+            exists = await self._nft_exists_head(mid, session)
             if exists:
                 logger.info(f"ID {mid} exists, adjusting lower bound")
                 lower_bound = mid
@@ -168,8 +252,9 @@ class NFTScanner:
         latest_id = lower_bound
         logger.info(f"Found latest NFT ID: {latest_id}")
 
-        # Verify this ID actually exists one more time
-        final_check = await self.check_nft(latest_id, session)
+        # Verify this ID actually exists one more time; the og:title
+        # marker in the page prefix is enough here, no full fetch+parse
+        final_check = await self._nft_exists_with_content_check(latest_id, session)
         if not final_check:
             logger.warning(
                 f"Binary search found ID {latest_id}, but final verification failed"
@@ -179,14 +264,13 @@ class NFTScanner:
                 test_id = latest_id - i - 1
                 if test_id < 1:
                     break
-                test_result = await self.check_nft(test_id, session)
-                if test_result:
+                if await self._nft_exists_with_content_check(test_id, session):
                     logger.info(f"Found valid ID {test_id} during fallback check")
-                    return test_id
+                    return test_id, True
             # If all else fails, return start_id
-            return self.start_id
+            return self.start_id, False
 
-        return latest_id
+        return latest_id, final_check
 
     async def _nft_exists(self, nft_id: int, session: ClientSession) -> bool:
         """
@@ -199,7 +283,7 @@ class NFTScanner:
         Returns:
             True if NFT exists, False otherwise
         """
-        url = f"{self.base_url}{self.gift_name}-{nft_id}"
+        url = self._url_prefix + str(nft_id)
         try:
             async with session.get(url, timeout=self.timeout) as response:
                 return response.status == 200
@@ -210,6 +294,33 @@ class NFTScanner:
             logger.warning(f"Error checking NFT {nft_id}: {e}")
             return False
 
+    async def _nft_exists_head(self, nft_id: int, session: ClientSession) -> bool:
+        """
+        Check if an NFT with the given ID exists using a HEAD request.
+
+        The latest-ID search only needs a yes/no per probe, so skipping the
+        body transfer and HTML parse makes each probe a status check.
+
+        Args:
+            nft_id: ID to check
+            session: ClientSession to use for request
+
+        Returns:
+            True if NFT exists, False otherwise
+        """
+        url = self._url_prefix + str(nft_id)
+        try:
+            async with session.head(
+                url, timeout=self.timeout, allow_redirects=False
+            ) as response:
+                return response.status == 200
+        except asyncio.TimeoutError:
+            logger.warning(f"Request for ID {nft_id} timed out")
+            return False
+        except Exception as e:
+            logger.warning(f"Error checking NFT {nft_id}: {e}")
+            return False
+
     async def _nft_exists_with_content_check(
         self, nft_id: int, session: ClientSession
     ) -> bool:
@@ -223,16 +334,16 @@ class NFTScanner:
         Returns:
             True if NFT exists and has valid content, False otherwise
         """
-        url = f"{self.base_url}{self.gift_name}-{nft_id}"
+        url = self._url_prefix + str(nft_id)
         try:
             async with session.get(url, timeout=self.timeout) as response:
                 if response.status != 200:
                     return False
 
-                # Check content to verify it's a valid NFT page
-                html = await response.text()
-                nft = parse_nft_page(html, nft_id, self.gift_name)
-                return nft is not None
+                # The og:title marker near the top of the page is enough
+                # to confirm a valid NFT page without parsing any HTML
+                head = await response.content.read(4096)
+                return bool(self._nft_marker_re.search(head))
 
         except asyncio.TimeoutError:
             logger.warning(f"Request for ID {nft_id} timed out")
@@ -252,10 +363,19 @@ class NFTScanner:
         Returns:
             NFT object if found, None otherwise
         """
-        url = f"{self.base_url}{self.gift_name}-{nft_id}"
+        # Serve recent misses from the negative cache instead of re-probing
+        cached_at = self._miss_cache.get(nft_id)
+        if cached_at is not None:
+            if time.monotonic() - cached_at < self._MISS_TTL:
+                return None
+            # Stale entry; probe again in case the ID has been minted since
+            del self._miss_cache[nft_id]
+
+        url = self._url_prefix + str(nft_id)
         try:
             async with session.get(url, timeout=self.timeout) as response:
                 if response.status != 200:
+                    self._record_miss(nft_id)
                     return None
 
                 html = await response.text()
@@ -265,6 +385,29 @@ class NFTScanner:
             logger.error(f"Error checking NFT {nft_id}: {e}")
             return None
 
+    def _record_miss(self, nft_id: int) -> None:
+        """Remember a missing ID so it is not re-probed within the TTL."""
+        self._miss_cache[nft_id] = time.monotonic()
+        self._miss_cache.move_to_end(nft_id)
+        while len(self._miss_cache) > self._MISS_CACHE_MAX:
+            self._miss_cache.popitem(last=False)
+
+    async def _bounded_check_nft(
+        self, nft_id: int, session: ClientSession
+    ) -> Optional[NFT]:
+        """
+        Check an NFT while holding the shared concurrency semaphore.
+
+        Args:
+            nft_id: ID to check
+            session: ClientSession to use for request
+
+        Returns:
+            NFT object if found, None otherwise
+        """
+        async with self._check_sem:
+            return await self.check_nft(nft_id, session)
+
     async def download_nft_image(self, nft: NFT, session: ClientSession) -> bool:
         """
         Download NFT image and save it to the output directory.
@@ -285,99 +428,116 @@ class NFTScanner:
         Returns:
             List of found NFTs
         """
-        async with ClientSession(timeout=self.timeout) as session:
-            # If enabled, find the latest NFT ID, but only if we don't have a recent saved ID
-            should_skip_search = self._loaded_from_file and self.respect_saved
-
-            if self.find_latest and not should_skip_search:
-                # We'll only run the latest check if find_latest is enabled AND we either
-                # 1. Didn't load from file, or
-                # 2. Are explicitly ignoring saved files (respect_saved=False)
-                logger.info(
-                    f"Finding latest NFT ID starting from current ID: {self.current_id}"
-                )
-                latest_id = await self.find_latest_nft_id(session)
+        try:
+            async with self._make_session() as session:
+                # If enabled, find the latest NFT ID, but only if we don't have a recent saved ID
+                should_skip_search = self._loaded_from_file and self.respect_saved
+
+                if self.find_latest and not should_skip_search:
+                    # We'll only run the latest check if find_latest is enabled AND we either
+                    # 1. Didn't load from file, or
+                    # 2. Are explicitly ignoring saved files (respect_saved=False)
+                    logger.info(
+                        f"Finding latest NFT ID starting from current ID: {self.current_id}"
+                    )
+                    latest_id, verified = await self.find_latest_nft_id(session)
 
-                # Double-check that this ID is valid before proceeding
-                latest_nft = await self.check_nft(latest_id, session)
-                if not latest_nft:
-                    logger.warning(
-                        f"Found latest ID {latest_id} but verification failed, falling back to current ID {self.current_id}"
+                    # The search verifies the ID with a cheap page-prefix
+                    # marker check; the scan loop below does the full fetch
+                    if not verified:
+                        logger.warning(
+                            f"Found latest ID {latest_id} but verification failed, falling back to current ID {self.current_id}"
+                        )
+                        latest_id = self.current_id
+
+                    # Calculate how many NFTs back we need to go to get max_nfts
+                    # but never go below our current ID
+                    start_id = max(self.current_id, latest_id - self.max_nfts + 1)
+                    self.current_id = start_id
+                    logger.info(
+                        f"Latest NFT ID: {latest_id}. Starting scan from ID {start_id} to get up to {self.max_nfts} latest NFTs"
+                    )
+                elif should_skip_search:
+                    logger.info(
+                        f"Using saved ID from file: {self.current_id - 1}, skipping binary search and starting scan from {self.current_id}"
                     )
-                    latest_id = self.current_id
 
-                # Calculate how many NFTs back we need to go to get max_nfts
-                # but never go below our current ID
-                start_id = max(self.current_id, latest_id - self.max_nfts + 1)
-                self.current_id = start_id
-                logger.info(
-                    f"Latest NFT ID: {latest_id}. Starting scan from ID {start_id} to get up to {self.max_nfts} latest NFTs"
-                )
-            elif should_skip_search:
-                logger.info(
-                    f"Using saved ID from file: {self.current_id - 1}, skipping binary search and starting scan from {self.current_id}"
+                # Main scanning loop
+                valid_results = 0
+                consecutive_empty = 0
+                max_consecutive_empty = (
+                    10  # Stop scanning after this many consecutive misses
                 )
 
-            # Main scanning loop
-            valid_results = 0
-            consecutive_empty = 0
-            max_consecutive_empty = (
-                10  # Stop scanning after this many consecutive misses
-            )
+                # Collect all found NFTs during this scan
+                newly_found_nfts = []
 
-            # Collect all found NFTs during this scan
-            newly_found_nfts = []
+                while (
+                    valid_results < self.max_nfts
+                    and consecutive_empty < max_consecutive_empty
+                ):
+                    # Probe a window of IDs concurrently; the semaphore in
+                    # _bounded_check_nft keeps the fan-out polite
+                    window = range(self.current_id, self.current_id + self.scan_window)
+                    logger.info(
+                        f"Checking NFT IDs: {window.start}-{window.stop - 1}"
+                    )
 
-            while (
-                valid_results < self.max_nfts
-                and consecutive_empty < max_consecutive_empty
-            ):
-                logger.info(f"Checking NFT ID: {self.current_id}")
+                    results = await asyncio.gather(
+                        *(self._bounded_check_nft(i, session) for i in window)
+                    )
 
-                nft = await self.check_nft(self.current_id, session)
+                    # Walk the window in ID order so the consecutive-miss
+                    # stop rule behaves exactly as the serial loop did
+                    for nft_id, nft in zip(window, results):
+                        if valid_results >= self.max_nfts:
+                            break
 
-                if nft:
-                    logger.info(f"Found NFT: {nft.name} {nft.full_id}")
-                    self.found_nfts.append(nft)
-                    newly_found_nfts.append(nft)
-                    await self.download_nft_image(nft, session)
-                    valid_results += 1
-                    consecutive_empty = 0  # Reset counter on successful find
-                else:
-                    consecutive_empty += 1
-                    if consecutive_empty >= max_consecutive_empty:
+                        if nft:
+                            logger.info(f"Found NFT: {nft.name} {nft.full_id}")
+                            self.found_nfts.append(nft)
+                            self._max_seen_id = max(self._max_seen_id, nft.id)
+                            newly_found_nfts.append(nft)
+                            await self.download_nft_image(nft, session)
+                            valid_results += 1
+                            consecutive_empty = 0  # Reset counter on successful find
+                        else:
+                            consecutive_empty += 1
+                            if consecutive_empty >= max_consecutive_empty:
+                                logger.info(
+                                    f"Reached {max_consecutive_empty} consecutive NFTs not found, stopping scan"
+                                )
+                                break
+
+                        self.current_id = nft_id + 1
+
+                # Save the last checked ID for continuity
+                if valid_results > 0:
+                    # Save the highest ID we got
+                    await self.state_manager.save_last_id_async(self._max_seen_id)
+
+                    # Send notifications for all newly found NFTs
+                    if newly_found_nfts:
                         logger.info(
-                            f"Reached {max_consecutive_empty} consecutive NFTs not found, stopping scan"
+                            f"Sending notifications for {len(newly_found_nfts)} newly found NFTs"
                         )
-                        break
+                        # Send a batch notification about all found NFTs
+                        await self.telegram.send_batch_notification(newly_found_nfts)
 
-                self.current_id += 1
-                await asyncio.sleep(1)  # Wait 1 second between requests
+                        # Also send TGS stickers if any match criteria
+                        await self.telegram.send_tgs_stickers(newly_found_nfts)
 
-            # Save the last checked ID for continuity
-            if valid_results > 0:
-                # Find the highest ID we got
-                highest_id = max(nft.id for nft in self.found_nfts)
-                self._save_last_id(highest_id)
-
-                # Send notifications for all newly found NFTs
-                if newly_found_nfts:
-                    logger.info(
-                        f"Sending notifications for {len(newly_found_nfts)} newly found NFTs"
-                    )
-                    # Send a batch notification about all found NFTs
-                    await self.telegram.send_batch_notification(newly_found_nfts)
+                self.print_summary()
 
-                    # Also send TGS stickers if any match criteria
-                    await self.telegram.send_tgs_stickers(newly_found_nfts)
+                # If monitoring mode is enabled, start continuous monitoring
+                if self.monitor:
+                    await self.monitor_new_nfts(session)
 
-            self.print_summary()
-
-            # If monitoring mode is enabled, start continuous monitoring
-            if self.monitor:
-                await self.monitor_new_nfts(session)
-
-            return list(self.found_nfts)
+                return list(self.found_nfts)
+        finally:
+            # The Telegram client outlives any one send; close its
+            # pooled connections when the scan session ends
+            await self.telegram.aclose()
 
     async def monitor_new_nfts(self, session: ClientSession):
         """
@@ -387,56 +547,30 @@ class NFTScanner:
             session: ClientSession to use for requests
         """
         if self.found_nfts:
-            highest_id = max(nft.id for nft in self.found_nfts)
-            next_id = highest_id + 1
+            next_id = self._max_seen_id + 1
         else:
             next_id = self.current_id
 
         logger.info(f"Starting continuous monitoring for new NFTs from ID {next_id}")
         logger.info("Will poll for up to 10 seconds. Press Ctrl+C to stop.")
 
+        flusher = asyncio.create_task(self._state_flusher())
         try:
             while True:
-                batch_nfts = []
-                poll_start = next_id
-                poll_current = poll_start
-                found_gap = False
-                consecutive_not_found = 0
-                max_consecutive_not_found = 5  # Stop after 5 consecutive NFTs not found
-
-                # Try to find NFTs for up to 10 seconds
+                self._partial_batch = []
+                self._poll_found_gap = False
                 poll_start_time = time.time()
-                poll_deadline = poll_start_time + 10  # Check for up to 10 seconds
 
-                # Keep checking until either:
-                # 1. We hit 5 consecutive not found
-                # 2. 10 seconds have passed
-                while (
-                    time.time() < poll_deadline
-                    and consecutive_not_found < max_consecutive_not_found
-                ):
-                    nft = await self.check_nft(poll_current, session)
-                    if nft:
-                        logger.info(
-                            f"New NFT found and added to batch: {nft.name} {nft.full_id} (ID: {nft.id})"
-                        )
-                        self.found_nfts.append(nft)
-                        batch_nfts.append(nft)
-                        poll_current += 1
-                        consecutive_not_found = 0  # Reset counter on successful find
-                    else:
-                        consecutive_not_found += 1
-                        if consecutive_not_found >= max_consecutive_not_found:
-                            logger.info(
-                                f"Reached {max_consecutive_not_found} consecutive NFTs not found, stopping search"
-                            )
-                            found_gap = True
-                            break
-                        logger.info(
-                            f"NFT ID {poll_current} not found, checking next ID"
-                        )
-                        poll_current += 1
-                        await asyncio.sleep(0.5)
+                # Let the event loop enforce the 10s polling deadline
+                # instead of re-checking time.time() every iteration;
+                # progress survives the cancellation via _partial_batch
+                try:
+                    batch_nfts = await asyncio.wait_for(
+                        self._poll_window(session, next_id), timeout=10
+                    )
+                except asyncio.TimeoutError:
+                    batch_nfts = self._partial_batch
+                found_gap = self._poll_found_gap
 
                 elapsed_time = time.time() - poll_start_time
                 logger.info(
@@ -445,16 +579,19 @@ class NFTScanner:
 
                 # Only update next_id if we found at least one NFT
                 if batch_nfts:
-                    # Update next_id to the ID after the last found NFT
-                    next_id = max(nft.id for nft in batch_nfts) + 1
+                    # Update next_id to the ID after the last found NFT;
+                    # batch finds already fed the running maximum
+                    next_id = self._max_seen_id + 1
                     logger.info(f"Updated next ID to {next_id} for next polling cycle")
 
-                    # Save the highest ID we've found
-                    self._save_last_id(next_id - 1)
+                    # Stage the highest ID for the debounced flusher
+                    self._pending_save_id = max(self._pending_save_id or 0, next_id - 1)
 
-                    # Send notification about all found NFTs
-                    # The send_batch_notification method will handle single NFTs specially
-                    await self.telegram.send_batch_notification(batch_nfts)
+                    # Enqueue all found NFTs; the client coalesces them into
+                    # one batched message per flush window, so back-to-back
+                    # polling cycles share a single sendMessage call
+                    for nft in batch_nfts:
+                        await self.telegram.enqueue_nft(nft)
 
                     # Also alert in the console if running locally
                     if len(batch_nfts) == 1:
@@ -474,18 +611,90 @@ class NFTScanner:
                         f"Timeout without finding NFTs. Moving to next ID {next_id}"
                     )
 
-                # If no NFTs found, sleep for a longer period to avoid hammering the server
+                # If no NFTs found, back off exponentially to avoid hammering
+                # the server while the collection is idle
                 if not batch_nfts:
                     logger.info(
-                        "No new NFTs found in this polling period. Waiting 5 seconds..."
+                        f"No new NFTs found in this polling period. Waiting {self._idle_backoff:.0f} seconds..."
                     )
-                    await asyncio.sleep(5)  # Rest longer when no NFTs are found
+                    await asyncio.sleep(self._idle_backoff)
+                    self._idle_backoff = min(self._idle_backoff * 2, 60)
+                else:
+                    self._idle_backoff = 5.0
 
         except KeyboardInterrupt:
             logger.info("Monitoring stopped by user.")
         except Exception as e:
             logger.error(f"Error during monitoring: {e}")
             logger.exception("Full exception details:")
+        finally:
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+            # One last write so the final batch survives shutdown
+            if self._pending_save_id is not None:
+                await self.state_manager.save_last_id_async(self._pending_save_id)
+
+    async def _state_flusher(self):
+        """Persist the pending last-seen ID at most once per interval."""
+        last_written = None
+        while True:
+            await asyncio.sleep(5)
+            pending = self._pending_save_id
+            if pending is not None and pending != last_written:
+                await self.state_manager.save_last_id_async(pending)
+                last_written = pending
+
+    async def _poll_window(self, session: ClientSession, start_id: int) -> list:
+        """
+        Probe IDs from start_id until a gap of consecutive misses appears.
+
+        Runs under the caller's asyncio.wait_for deadline; finds accumulate
+        on self._partial_batch (with the gap flag on self._poll_found_gap)
+        so a timeout cancellation still hands back everything found.
+
+        Args:
+            session: ClientSession to use for requests
+            start_id: First ID to probe
+
+        Returns:
+            The list of NFTs found in this window
+        """
+        poll_current = start_id
+        consecutive_not_found = 0
+        max_consecutive_not_found = 5  # Stop after 5 consecutive NFTs not found
+
+        while consecutive_not_found < max_consecutive_not_found:
+            # Probe a window of candidate IDs concurrently, then walk the
+            # results in order to preserve the gap-stop rule
+            window = range(poll_current, poll_current + max_consecutive_not_found)
+            results = await asyncio.gather(
+                *(self._bounded_check_nft(i, session) for i in window)
+            )
+
+            for nft_id, nft in zip(window, results):
+                if nft:
+                    logger.info(
+                        f"New NFT found and added to batch: {nft.name} {nft.full_id} (ID: {nft.id})"
+                    )
+                    self.found_nfts.append(nft)
+                    self._max_seen_id = max(self._max_seen_id, nft.id)
+                    self._partial_batch.append(nft)
+                    consecutive_not_found = 0  # Reset counter on successful find
+                else:
+                    consecutive_not_found += 1
+                    if consecutive_not_found >= max_consecutive_not_found:
+                        logger.info(
+                            f"Reached {max_consecutive_not_found} consecutive NFTs not found, stopping search"
+                        )
+                        self._poll_found_gap = True
+                        return self._partial_batch
+                    logger.info(f"NFT ID {nft_id} not found, checking next ID")
+                poll_current = nft_id + 1
+
+        return self._partial_batch
 
     def print_summary(self):
         """Print a summary of the found NFTs."""
@@ -538,19 +747,15 @@ class NFTScanner:
             for prop, info in nft.rarity.items():
                 rarity_str = f" ({info['rarity']})" if info["rarity"] else ""
 
-                # Highlight rare properties
+                # Highlight rare properties; the memoized parser has
+                # usually seen these exact strings already
                 is_rare_prop = False
-                try:
-                    if info["rarity"]:
-                        rarity_value = float(
-                            info["rarity"].strip().replace("%", "").replace(",", ".")
-                        )
-                        if rarity_value < 0.6:
-                            is_rare_prop = "🔥🔥 SUPER RARE"
-                        elif rarity_value < 1.8:
-                            is_rare_prop = "🔥 RARE"
-                except (ValueError, TypeError):
-                    pass
+                rarity_value = parse_rarity(info["rarity"]) if info["rarity"] else None
+                if rarity_value is not None:
+                    if rarity_value < 0.6:
+                        is_rare_prop = "🔥🔥 SUPER RARE"
+                    elif rarity_value < 1.8:
+                        is_rare_prop = "🔥 RARE"
 
                 print(
                     f"  - {prop}: {info['value']}{rarity_str} {is_rare_prop if is_rare_prop else ''}"
@@ -1,5 +1,5 @@
 """NFT models package."""
 
-from .nft import NFT
+from .nft import NFT, parse_rarity
 
-__all__ = ["NFT"]
+__all__ = ["NFT", "parse_rarity"]
@@ -1,7 +1,32 @@
 """NFT data model class."""
 
+import re
 from dataclasses import dataclass, field
-from typing import Dict, List
+from functools import cached_property, lru_cache
+from typing import Dict, List, Optional
+
+# Numeric fragment of a rarity string like "1,5%"; the pattern only
+# admits an integer with at most one decimal separator, so every match
+# is guaranteed to survive float() after the comma swap
+_RARITY_RE = re.compile(r"(\d+(?:[.,]\d+)?)")
+
+
+@lru_cache(maxsize=1024)
+def parse_rarity(text: str) -> Optional[float]:
+    """
+    Parse a rarity string like "1,5%" to its numeric value.
+
+    Rarity strings repeat heavily across NFTs and alerts, so results are
+    memoized rather than re-parsed per call.
+
+    Args:
+        text: Raw rarity string from the page
+
+    Returns:
+        The rarity value, or None if the string has no number
+    """
+    match = _RARITY_RE.search(text)
+    return float(match.group(1).replace(",", ".")) if match else None
 
 
 @dataclass
@@ -20,21 +45,35 @@ class NFT:
     super_rare_properties: List[str] = field(default_factory=list)
     rare_properties: List[str] = field(default_factory=list)
 
+    @cached_property
+    def model_rarity_pct(self) -> Optional[float]:
+        """
+        Parsed Model rarity percentage, or None if absent or malformed.
+
+        Computed at most once per NFT; every rarity check downstream
+        branches off this cached float instead of re-parsing the string.
+        """
+        model_info = self.rarity.get("Model") if self.rarity else None
+        if not model_info:
+            return None
+        model_rarity = model_info.get("rarity", "")
+        return parse_rarity(model_rarity) if model_rarity else None
+
     @property
     def url(self) -> str:
         """Return the URL to the NFT."""
         return f"https://t.me/nft/{self.gift_name}-{self.id}"
 
-    @property
+    @cached_property
     def filename(self) -> str:
-        """Return the filename for the NFT image."""
+        """Return the filename for the NFT image, built once per NFT."""
         return (
             f"{self.gift_name.lower()}-{self.name.lower().replace(' ', '-')}-{self.id}"
         )
 
-    @property
+    @cached_property
     def file_extension(self) -> str:
-        """Return the file extension for the NFT image."""
+        """Return the file extension for the NFT image, resolved once per NFT."""
         return (
             ".tgs"
             if self.image_type == "tgs"
@@ -56,27 +95,17 @@ class NFT:
         self.rare_properties = []
 
         # Only check Model property for rarity
-        if not self.rarity or "Model" not in self.rarity:
+        rarity_value = self.model_rarity_pct
+        if rarity_value is None:
             return
 
         model_info = self.rarity["Model"]
-        model_rarity = model_info.get("rarity")
-
-        if not model_rarity:
-            return
+        model_name = model_info.get("value", "")
+        model_rarity = model_info.get("rarity", "")
 
-        try:
-            rarity_text = model_rarity.strip().replace("%", "").replace(",", ".")
-            rarity_value = float(rarity_text)
-            model_name = model_info.get("value", "")
-
-            if rarity_value < 0.6:
-                self.is_super_rare = True
-                self.super_rare_properties.append(
-                    f"Model: {model_name} ({model_rarity})"
-                )
-            elif rarity_value < 1.8:
-                self.is_rare = True
-                self.rare_properties.append(f"Model: {model_name} ({model_rarity})")
-        except (ValueError, TypeError):
-            pass
+        if rarity_value < 0.6:
+            self.is_super_rare = True
+            self.super_rare_properties.append(f"Model: {model_name} ({model_rarity})")
+        elif rarity_value < 1.8:
+            self.is_rare = True
+            self.rare_properties.append(f"Model: {model_name} ({model_rarity})")
@@ -1,5 +1,6 @@
 """State management for persisting NFT scanner state between runs."""
 
+import asyncio
 import json
 import os
 import time
@@ -96,3 +97,19 @@ class StateManager:
         except Exception as e:
             logger.error(f"Failed to save last ID to {self.state_file}: {e}")
             return False
+
+    async def save_last_id_async(self, last_id: int) -> bool:
+        """
+        Save the last processed NFT ID without blocking the event loop.
+
+        The write/replace pair in save_last_id is synchronous disk I/O;
+        async callers on the hot path should use this wrapper, which runs
+        it in a worker thread.
+
+        Args:
+            last_id: Last ID that was processed
+
+        Returns:
+            True if the save was successful, False otherwise
+        """
+        return await asyncio.to_thread(self.save_last_id, last_id)
@@ -1,7 +1,14 @@
 """Utility functions for the NFT scanner."""
 
-from .logging import setup_logger
-from .html_parser import extract_rarity_info, parse_nft_page
+from .logging import log_if, setup_logger
+from .html_parser import extract_rarity_info, parse_nft_batch, parse_nft_page
 from .image_handler import ImageHandler
 
-__all__ = ["setup_logger", "extract_rarity_info", "parse_nft_page", "ImageHandler"]
+__all__ = [
+    "setup_logger",
+    "log_if",
+    "extract_rarity_info",
+    "parse_nft_batch",
+    "parse_nft_page",
+    "ImageHandler",
+]
@@ -1,56 +1,133 @@
 """HTML parsing utilities for the NFT scanner."""
 
 import re
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from src.nft_scanner.models import NFT
 
+# Lexbor parses the page in native code, an order of magnitude faster
+# than a generic HTML parser for this grab-a-few-selectors pattern; the
+# lxml path below remains the fallback when selectolax is not installed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
-def extract_rarity_info(soup: BeautifulSoup) -> Dict[str, Dict[str, str]]:
+# Numeric part of a full ID like "Collection #123"
+_ID_RE = re.compile(r"#(\d+)")
+
+# Selectors for the Lexbor path, defined once so per-page parses reuse
+# the same strings instead of rebuilding them on every call
+_NAME_SELECTOR = "text[font-size='23']"
+_FULL_ID_SELECTOR = "text[font-size='15']"
+_TGS_SELECTOR = "picture.tgme_gift_model source[type='application/x-tgsticker']"
+_SVG_SELECTOR = "picture.tgme_gift_model source[type='image/svg+xml']"
+_RARITY_ROW_SELECTOR = ".tgme_gift_table tr"
+
+# Shared parser and precompiled XPath objects for the lxml fallback;
+# reusing one parser instance and compiled expressions keeps the whole
+# tree-walk in C with no per-call setup cost
+_HTML_PARSER = etree.HTMLParser(recover=True, remove_blank_text=True)
+_X_NAME = etree.XPath("//text[@font-size='23']/text()")
+_X_FULL_ID = etree.XPath("//text[@font-size='15']/text()")
+_X_TGS = etree.XPath(
+    "//picture[contains(@class,'tgme_gift_model')]"
+    "/source[@type='application/x-tgsticker']/@srcset"
+)
+_X_SVG = etree.XPath(
+    "//picture[contains(@class,'tgme_gift_model')]"
+    "/source[@type='image/svg+xml']/@srcset"
+)
+_X_TABLE_ROWS = etree.XPath("//table[contains(@class,'tgme_gift_table')]//tr")
+
+
+def extract_rarity_info(root) -> Dict[str, Dict[str, str]]:
     """
-    Extract rarity information from the NFT page.
+    Extract rarity information from an lxml-parsed NFT page.
 
     Args:
-        soup: BeautifulSoup object of the NFT page
+        root: lxml element tree of the NFT page
 
     Returns:
         Dictionary of rarity information
     """
     rarity_info = {}
 
-    # Find the rarity table
-    rarity_table = soup.select_one(".tgme_gift_table")
-    if not rarity_table:
-        return rarity_info
+    for row in _X_TABLE_ROWS(root):
+        # Each row has a header (property name) and value with possible rarity percentage
+        header = row.find("th")
+        value_cell = row.find("td")
+
+        if header is None or value_cell is None:
+            continue
+
+        property_name = "".join(header.itertext()).strip()
+
+        # Check if there's a rarity mark; the cell text is assembled
+        # while skipping the mark subtree, one pass instead of building
+        # both strings and substring-replacing (which could also clobber
+        # a value that happens to contain the percentage text)
+        rarity_mark = value_cell.find(".//mark")
+        if rarity_mark is not None:
+            rarity_percentage = "".join(rarity_mark.itertext()).strip()
+            parts = [value_cell.text or ""]
+            for child in value_cell:
+                if child is not rarity_mark:
+                    parts.append("".join(child.itertext()))
+                parts.append(child.tail or "")
+            property_value = "".join(parts).strip()
+        else:
+            property_value = "".join(value_cell.itertext()).strip()
+            rarity_percentage = None
+
+        rarity_info[property_name] = {
+            "value": property_value,
+            "rarity": rarity_percentage,
+        }
+
+    return rarity_info
 
-    # Extract rows from the table
-    rows = rarity_table.select("tr")
-    for row in rows:
+
+def _extract_rarity_info_lexbor(tree) -> Dict[str, Dict[str, str]]:
+    """
+    Extract rarity information from a Lexbor-parsed NFT page.
+
+    Args:
+        tree: LexborHTMLParser tree of the NFT page
+
+    Returns:
+        Dictionary of rarity information
+    """
+    rarity_info = {}
+
+    for row in tree.css(_RARITY_ROW_SELECTOR):
         # Each row has a header (property name) and value with possible rarity percentage
-        header = row.select_one("th")
-        value_cell = row.select_one("td")
-
-        if header and value_cell:
-            property_name = header.text.strip()
-
-            # Check if there's a rarity mark
-            rarity_mark = value_cell.select_one("mark")
-            if rarity_mark:
-                # Extract the property value without the rarity percentage
-                property_value = (
-                    value_cell.get_text().replace(rarity_mark.text, "").strip()
-                )
-                rarity_percentage = rarity_mark.text.strip()
-            else:
-                property_value = value_cell.text.strip()
-                rarity_percentage = None
-
-            rarity_info[property_name] = {
-                "value": property_value,
-                "rarity": rarity_percentage,
-            }
+        header = row.css_first("th")
+        value_cell = row.css_first("td")
+
+        if header is None or value_cell is None:
+            continue
+
+        property_name = header.text().strip()
+
+        # Check if there's a rarity mark; detaching it before reading
+        # the cell text gives the value in one pass instead of building
+        # both strings and substring-replacing
+        rarity_mark = value_cell.css_first("mark")
+        if rarity_mark is not None:
+            rarity_percentage = rarity_mark.text().strip()
+            rarity_mark.decompose()
+            property_value = value_cell.text().strip()
+        else:
+            property_value = value_cell.text().strip()
+            rarity_percentage = None
+
+        rarity_info[property_name] = {
+            "value": property_value,
+            "rarity": rarity_percentage,
+        }
 
     return rarity_info
 
@@ -67,68 +144,166 @@ def parse_nft_page(html: str, nft_id: int, gift_name: str) -> Optional[NFT]:
     Returns:
         NFT object if parsing was successful, None otherwise
     """
+    # Every successful parse needs the gift-model picture, so a C-level
+    # substring probe rejects error and placeholder pages in microseconds
+    # without paying for tree construction
+    if "tgme_gift_model" not in html:
+        return None
+
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        if LexborHTMLParser is not None:
+            return _parse_nft_page_lexbor(html, nft_id, gift_name)
+        return _parse_nft_page_etree(html, nft_id, gift_name)
+    except Exception:
+        # Log error and return None
+        return None
 
-        # Extract NFT name
-        name_element = soup.select_one("text[font-size='23']")
-        if not name_element:
-            return None
-        nft_name = name_element.text.strip()
 
-        # Extract NFT full ID (including collection number)
-        id_element = soup.select_one("text[font-size='15']")
-        if not id_element:
+def parse_nft_batch(pages: List[Tuple[str, int, str]]) -> List[Optional[NFT]]:
+    """
+    Parse a batch of NFT pages in one call.
+
+    Parsing is pure CPU with no shared state, so bulk scans can fan
+    batches out to a ProcessPoolExecutor (e.g. ``executor.map`` with
+    batches of ~64 pages) and amortize the per-task IPC cost; both this
+    helper and parse_nft_page are plain module functions and picklable.
+
+    Args:
+        pages: (html, nft_id, gift_name) tuples, one per page
+
+    Returns:
+        Parse results in input order, None where a page failed to parse
+    """
+    return [
+        parse_nft_page(html, nft_id, gift_name) for html, nft_id, gift_name in pages
+    ]
+
+
+def _parse_nft_page_lexbor(html: str, nft_id: int, gift_name: str) -> Optional[NFT]:
+    """
+    Parse an NFT page with the Lexbor backend.
+
+    Args:
+        html: HTML content of the NFT page
+        nft_id: ID of the NFT
+        gift_name: Name of the NFT gift collection
+
+    Returns:
+        NFT object if parsing was successful, None otherwise
+    """
+    tree = LexborHTMLParser(html)
+
+    # Extract NFT name
+    name_element = tree.css_first(_NAME_SELECTOR)
+    if name_element is None:
+        return None
+    nft_name = name_element.text().strip()
+
+    # Extract NFT full ID (including collection number)
+    id_element = tree.css_first(_FULL_ID_SELECTOR)
+    if id_element is None:
+        return None
+    full_id = id_element.text().strip()
+
+    # Extract image URL
+    image_element = tree.css_first(_TGS_SELECTOR)
+    if image_element is None:
+        # Try the SVG version if TGS sticker not found
+        image_element = tree.css_first(_SVG_SELECTOR)
+        if image_element is None:
             return None
-        full_id = id_element.text.strip()
-
-        # Extract just the numeric part
-        id_match = re.search(r"#(\d+)", full_id)
-        nft_number = nft_id if not id_match else id_match.group(1)
-
-        # Extract image URL
-        image_element = soup.select_one(
-            "picture.tgme_gift_model source[type='application/x-tgsticker']"
-        )
-        if not image_element:
-            # Try the SVG version if TGS sticker not found
-            image_element = soup.select_one(
-                "picture.tgme_gift_model source[type='image/svg+xml']"
-            )
-            if not image_element:
-                return None
-
-        image_url = image_element.get("srcset", "")
-
-        # If it's a data URI, we'll need to handle it differently
-        if isinstance(image_url, str) and image_url.startswith("data:"):
-            image_type = "svg"
-        else:
-            image_type = (
-                "tgs"
-                if isinstance(image_url, str) and "sticker.tgs" in image_url
-                else "unknown"
-            )
-
-        # Extract rarity information
-        rarity_info = extract_rarity_info(soup)
-
-        # Create NFT object
-        nft = NFT(
-            id=nft_id,
-            name=nft_name,
-            full_id=full_id,
-            image_url=image_url,
-            image_type=image_type,
-            rarity=rarity_info,
-            gift_name=gift_name,
-        )
-
-        # Analyze rarity
-        nft.determine_super_rarity()
-
-        return nft
 
-    except Exception:
-        # Log error and return None
+    image_url = image_element.attributes.get("srcset") or ""
+
+    # If it's a data URI, we'll need to handle it differently
+    is_str = isinstance(image_url, str)
+    if is_str and image_url.startswith("data:"):
+        image_type = "svg"
+    else:
+        image_type = "tgs" if is_str and image_url.endswith(".tgs") else "unknown"
+
+    # Extract rarity information
+    rarity_info = _extract_rarity_info_lexbor(tree)
+
+    # Create NFT object
+    nft = NFT(
+        id=nft_id,
+        name=nft_name,
+        full_id=full_id,
+        image_url=image_url,
+        image_type=image_type,
+        rarity=rarity_info,
+        gift_name=gift_name,
+    )
+
+    # Analyze rarity
+    nft.determine_super_rarity()
+
+    return nft
+
+
+def _parse_nft_page_etree(html: str, nft_id: int, gift_name: str) -> Optional[NFT]:
+    """
+    Parse an NFT page with the lxml fallback.
+
+    Args:
+        html: HTML content of the NFT page
+        nft_id: ID of the NFT
+        gift_name: Name of the NFT gift collection
+
+    Returns:
+        NFT object if parsing was successful, None otherwise
+    """
+    root = etree.fromstring(html, _HTML_PARSER)
+
+    # Extract NFT name
+    name_texts = _X_NAME(root)
+    if not name_texts:
         return None
+    nft_name = name_texts[0].strip()
+
+    # Extract NFT full ID (including collection number)
+    id_texts = _X_FULL_ID(root)
+    if not id_texts:
+        return None
+    full_id = id_texts[0].strip()
+
+    # Extract just the numeric part
+    id_match = _ID_RE.search(full_id)
+    nft_number = nft_id if not id_match else id_match.group(1)
+
+    # Extract image URL
+    srcsets = _X_TGS(root)
+    if not srcsets:
+        # Try the SVG version if TGS sticker not found
+        srcsets = _X_SVG(root)
+        if not srcsets:
+            return None
+
+    image_url = str(srcsets[0])
+
+    # If it's a data URI, we'll need to handle it differently
+    is_str = isinstance(image_url, str)
+    if is_str and image_url.startswith("data:"):
+        image_type = "svg"
+    else:
+        image_type = "tgs" if is_str and image_url.endswith(".tgs") else "unknown"
+
+    # Extract rarity information
+    rarity_info = extract_rarity_info(root)
+
+    # Create NFT object
+    nft = NFT(
+        id=nft_id,
+        name=nft_name,
+        full_id=full_id,
+        image_url=image_url,
+        image_type=image_type,
+        rarity=rarity_info,
+        gift_name=gift_name,
+    )
+
+    # Analyze rarity
+    nft.determine_super_rarity()
+
+    return nft
@@ -13,18 +13,31 @@ print(f"Python version: {sys.version}")
 print(f"Current directory: {os.getcwd()}")
 print(f"sys.path: {sys.path}")
 
-# Try importing the modules
+# Try importing the modules; each import sits on its own line so the
+# traceback points at the module that actually broke
 try:
+    from src.nft_scanner.config import Config  # noqa: F401
+
     print("✓ Successfully imported Config")
 
+    from src.nft_scanner.core import NFTScanner  # noqa: F401
+
     print("✓ Successfully imported NFTScanner")
 
+    from src.nft_scanner.models import NFT  # noqa: F401
+
     print("✓ Successfully imported NFT")
 
+    from src.nft_scanner.utils import setup_logger  # noqa: F401
+
     print("✓ Successfully imported setup_logger")
 
+    from src.nft_scanner.clients import TelegramClient  # noqa: F401
+
     print("✓ Successfully imported TelegramClient")
 
+    from src.nft_scanner.storage import StateManager  # noqa: F401
+
     print("✓ Successfully imported StateManager")
 
     print("\nAll imports successful!")